@@ -1,9 +1,103 @@
 import logging
 
 import math
+from functools import lru_cache
+
+import numpy
+
+try:
+  from scipy.optimize import brentq
+except ImportError:
+  brentq = None
 
 from . import KM2KFT
 
+try:
+  from numba import njit
+except ImportError:
+  njit = None
+
+def _maybe_njit( func ):
+  """Apply numba's njit when available; return the function unchanged otherwise"""
+
+  if njit is None:
+    return func
+  return njit( cache = True )( func )
+
+# Scalar thermodynamic kernels live at module level so numba can compile
+# them; the StandardAtmos methods forward to them. Signatures are left
+# unpinned so the same kernels also accept numpy arrays.
+@_maybe_njit
+def t2theta( temp, pres, R, Cp ):
+  return temp * (1.0e5 / pres)**(R / Cp)
+
+@_maybe_njit
+def theta2t( temp, pres, R, Cp ):
+  return temp / (1.0e5 / pres)**(R / Cp)
+
+@_maybe_njit
+def density( temp, pres, R ):
+  return pres / ( R * temp )
+
+@_maybe_njit
+def cal( p0, t0, a, h0, h1, g, R ):
+  if a != 0:
+    t1 = t0 + a * (h1 - h0)
+    p1 = p0 * (t1 / t0) ** (-g / a / R)
+  else:
+    t1 = t0
+    p1 = p0 * math.exp(-g / R / t0 * (h1 - h0))
+  return p1, t1
+
+def _fmid( a, b ):
+  """
+  Midpoint of two floats in ULP (bit-pattern) space
+
+  Reinterprets the float64 bounds as uint64, takes the integer midpoint,
+  and reinterprets back. Guarantees the bracket shrinks to 1 ULP in at
+  most ~64 steps regardless of the spread of the bounds, unlike the
+  arithmetic midpoint which stalls when the root sits near an endpoint.
+
+  """
+
+  a = numpy.float64( a ).view( numpy.uint64 )
+  b = numpy.float64( b ).view( numpy.uint64 )
+  return numpy.uint64( (a + b) // 2 ).view( numpy.float64 )
+
+def _bisect( func, h0, h1, xtol = 1.0e-3 ):
+  """
+  Bisection on the ULP midpoint; fallback root finder when scipy is missing
+
+  Arguments:
+    func : Residual function; must change sign over [h0, h1]
+    h0   : Lower bound of bracket
+    h1   : Upper bound of bracket
+
+  Keyword arguments:
+    xtol : Stop when the bracket is narrower than this
+
+  Returns:
+    float : Location of the root
+
+  """
+
+  f0  = func( h0 )
+  mid = _fmid( h0, h1 )
+  while (h1 - h0) > xtol:
+    fm = func( mid )
+    if (f0 < 0) == (fm < 0):                                                    # Root is in upper half of bracket
+      h0, f0 = mid, fm
+    else:                                                                       # Root is in lower half of bracket
+      h1 = mid
+    newMid = _fmid( h0, h1 )
+    if newMid == mid:                                                           # Bracket is 1 ULP wide; cannot shrink further
+      break
+    mid = newMid
+  return mid
+
+if brentq is None:
+  brentq = _bisect
+
 class StandardAtmos():
   g  =    9.80665
   R  =  287.00
@@ -22,37 +116,40 @@ class StandardAtmos():
     self.theta  = [] 
     prevh       = 0
 
+    p0, t0 = self.p0, self.t0
     for i in range(4):
-      pres, temp, theta, den = self.fromMeters( self.h[i] )      
-      self.p.append( pres )
-      self.t.append( temp )
-      self.theta.append( theta )
+      p0, t0 = self.cal( p0, t0, self.a[i], prevh, self.h[i] )
+      prevh  = self.h[i]
+      self.p.append( p0 )
+      self.t.append( t0 )
+      self.theta.append( self.t2theta( t0, p0 ) )
+
+    # Layer base states as arrays so fromMeters() can jump straight to the
+    # correct layer with a searchsorted() instead of walking the layers
+    self._hBase = numpy.array( [0]       + self.h )
+    self._pBase = numpy.array( [self.p0] + self.p )
+    self._tBase = numpy.array( [self.t0] + self.t )
+    self._aArr  = numpy.array( self.a )
 
   def t2theta(self, temp, pres):
     """Get potential temperature from air temperature and pressure"""
 
-    return temp * (1.0e5 / pres)**(self.R / self.Cp)
+    return t2theta( temp, pres, self.R, self.Cp )
 
   def theta2t(self, temp, pres):
     """Get temperature from potential temperature and pressure"""
 
-    return temp / (1.0e5 / pres)**(self.R / self.Cp)
+    return theta2t( temp, pres, self.R, self.Cp )
 
   def density(self, temp, pres):
     """Get density from air temperature and pressure"""
 
-    return pres / ( self.R * temp )
+    return density( temp, pres, self.R )
 
   def cal(self, p0, t0, a, h0, h1):
     """Used to calculate pressure and air temperature at give altitude"""
 
-    if a != 0:
-      t1 = t0 + a * (h1 - h0)
-      p1 = p0 * (t1 / t0) ** (-self.g / a / self.R)
-    else:
-      t1 = t0
-      p1 = p0 * math.exp(-self.g / self.R / t0 * (h1 - h0))
-    return p1, t1
+    return cal( p0, t0, a, h0, h1, self.g, self.R )
 
   def fromKilometers(self, alt):
     """Same as fromMeters(), but input is in units of km"""
@@ -88,18 +185,53 @@ class StandardAtmos():
 
     if alt < 0 or alt > 47000:
       raise Exception("altitude must be in [0, 47000] m")
-    p0    = self.p0 
-    t0    = self.t0
-    prevh = 0
-    for i in range(4):
-      if alt <= self.h[i]:
-        pres, temp = self.cal(p0, t0, self.a[i], prevh, alt)
-        theta      = self.t2theta( temp, pres )
-        return pres, temp, theta, self.density(temp, pres) 
-      else:
-        p0, t0 = self.cal(p0, t0, self.a[i], prevh, self.h[i])
-        prevh = self.h[i]
-  
+
+    i = max( numpy.searchsorted( self._hBase, alt ) - 1, 0 )                    # Index of layer containing alt; base states precomputed in __init__
+    pres, temp = self.cal( self._pBase[i], self._tBase[i], self.a[i], self._hBase[i], alt )
+    theta      = self.t2theta( temp, pres )
+    return pres, temp, theta, self.density(temp, pres)
+
+  def fromMetersArray(self, alts):
+    """
+    Vectorized version of fromMeters() for bulk altitude queries
+
+    Parameters
+    ----------
+    alts : array_like
+       Altitudes in m to get information for
+
+    Returns
+    -------
+    numpy.ndarray
+        Pressure in Pa
+    numpy.ndarray
+        Air temperatue in K
+    numpy.ndarray
+        Potential temperature in K
+    numpy.ndarray
+        Density in kg m**-3
+
+    """
+
+    alts = numpy.asarray( alts, dtype = numpy.float64 )
+    if (alts < 0).any() or (alts > 47000).any():
+      raise Exception("altitude must be in [0, 47000] m")
+
+    i  = numpy.maximum( numpy.searchsorted( self._hBase, alts ) - 1, 0 )        # Layer index for every altitude at once
+    p0 = self._pBase[i]
+    t0 = self._tBase[i]
+    a  = self._aArr[i]
+    h0 = self._hBase[i]
+
+    lapse = a != 0                                                              # Isothermal layers need the exponential form; guard the division by a
+    t1    = numpy.where( lapse, t0 + a * (alts - h0), t0 )
+    p1    = numpy.where( lapse,
+      p0 * (t1 / t0) ** (-self.g / numpy.where( lapse, a, 1.0 ) / self.R),
+      p0 * numpy.exp( -self.g / self.R / t0 * (alts - h0) )
+    )
+    theta = self.t2theta( t1, p1 )
+    return p1, t1, theta, self.density( t1, p1 )
+
   def fromhPa(self, pres):
     """Same as fromPa(), but input is in units of hPa"""
 
@@ -137,18 +269,9 @@ class StandardAtmos():
         else:                                                                   # Else, use surronding values
           h0, h1 = self.h[i-1:i+1]
         break
-    mid = (h0+h1)/2.0                                                       # Get middle of layer
-    p, t, theta, d = self.fromMeters( mid )                                        # Get pressure at layer
-
-    i = 50
-    while abs(p-pres) > 0.05 and i > 0:
-      if pres > p:                                                          # Requested pressure is between layer bottom and layer middle 
-        h1 = mid
-      else:                                                                 # Reauested layer is between layer middle and layer top
-        h0 = mid 
-      mid = (h0+h1)/2.0                                                       # Get middle of layer
-      p, t, theta, d = self.fromMeters( mid )                                        # Get pressure at layer
-      i -= 1
+
+    mid = brentq( lambda h: self.fromMeters( h )[0] - pres, h0, h1, xtol=1.0e-3 )# Root of pressure residual over the layer; converges in far fewer fromMeters() calls than bisection
+    p, t, theta, d = self.fromMeters( mid )
 
     return mid, t, theta, d
 
@@ -184,17 +307,14 @@ class StandardAtmos():
         else:                                                                   # Else, use surronding values
           h0, h1 = self.h[i-1:i+1]
         break
-    mid = (h0+h1)/2.0                                                           # Get middle of layer
-    p, t, theta, d = self.fromMeters( mid )                                     # Get pressure at layer
-
-    i = 50
-    while abs(theta-thetaIn) > 0.05 and i > 0:
-      if thetaIn < theta:                                                       # Requested pressure is between layer bottom and layer middle 
-        h1 = mid
-      else:                                                                     # Reauested layer is between layer middle and layer top
-        h0 = mid 
-      mid = (h0+h1)/2.0                                                         # Get middle of layer
-      p, t, theta, d = self.fromMeters( mid )                                   # Get pressure at layer
-      i -= 1
+
+    mid = brentq( lambda h: self.fromMeters( h )[2] - thetaIn, h0, h1, xtol=1.0e-3 )# Root of theta residual over the layer
+    p, t, theta, d = self.fromMeters( mid )
 
     return p, mid, t, d
+
+@lru_cache( maxsize = 1 )
+def getStandardAtmos():
+  """Shared StandardAtmos instance; initialization is amortized across widgets"""
+
+  return StandardAtmos()
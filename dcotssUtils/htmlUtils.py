@@ -1,7 +1,11 @@
+from array import array
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 
-from urllib.request import urlopen
+from urllib.request import urlopen, Request
 from urllib.parse import urlencode
+from urllib.error import HTTPError
 
 from xml.etree import ElementTree as ET
 
@@ -10,6 +14,18 @@ from metpy.units import units
 
 from bs4 import BeautifulSoup as BS
 
+try:                                                                            # Prefer the lxml C parser; fall back to the stdlib parser when missing
+  import lxml
+  PARSER = 'lxml'
+except ImportError:
+  PARSER = 'html.parser'
+
+try:                                                                            # Shared pool reuses TCP/TLS connections across downloads when available
+  import urllib3
+  _POOL = urllib3.PoolManager( maxsize = 4 )
+except ImportError:
+  _POOL = None
+
 
 FORECAST_URL = 'https://forecast.weather.gov/MapClick.php?lat=38.78&lon=-97.6442&unit=0&lg=english&FcstType=digital'
 METAR_URL    = 'https://www.aviationweather.gov/adds/dataserver_current'
@@ -36,13 +52,72 @@ WINDDIR = {
     'WNW' : 292.5,
 }
 
+# Normalized lookup so stray whitespace/case from BeautifulSoup text does
+# not silently turn a valid direction into NaN
+WINDDIR_FAST = { key.upper() : val for key, val in WINDDIR.items() }
+_NAN         = numpy.nan
+
 def urlJoin( *args ):
   args = [ arg.strip( '/' ) for arg in args ]
   return '/'.join(args)
 
+# Per-URL cache of (Last-Modified, ETag, body) used for HTTP conditional
+# GETs; a 304 Not Modified response skips the body transfer entirely.
+# LRU-bounded: outlook archive URLs are unique per issuance, so an
+# unbounded dict would grow by a day's worth of zip bodies forever
+_HTTP_CACHE     = OrderedDict()
+_HTTP_CACHE_MAX = 16
+
+def _cacheStore( url, lastMod, etag, data ):
+  """Insert/refresh a _HTTP_CACHE entry, evicting the stalest past the cap"""
+
+  _HTTP_CACHE[url] = (lastMod, etag, data)
+  _HTTP_CACHE.move_to_end( url )
+  while len( _HTTP_CACHE ) > _HTTP_CACHE_MAX:
+    _HTTP_CACHE.popitem( last = False )
+
+def _condHeaders( cached ):
+  """Conditional-GET headers for a _HTTP_CACHE entry; {} when nothing cached"""
+
+  headers = {}
+  if cached:
+    if cached[0]:
+      headers['If-Modified-Since'] = cached[0]
+    if cached[1]:
+      headers['If-None-Match'] = cached[1]
+  return headers
+
 def downloadPage( url = FORECAST_URL ):
+  cached  = _HTTP_CACHE.get( url )
+  if cached is not None:
+    _HTTP_CACHE.move_to_end( url )                                              # Revalidated URLs stay fresh in the LRU order
+  headers = _condHeaders( cached )
+
+  if _POOL is not None:                                                         # Keep-alive path; each urlopen() call would pay a fresh TCP+TLS handshake
+    try:
+      res = _POOL.request( 'GET', url, headers = headers )
+    except Exception as err:
+      print(err)
+      return None
+
+    if res.status == 304 and cached:                                            # Page unchanged since last download; reuse cached body
+      return cached[2]
+    if res.status != 200:
+      return None
+
+    lastMod = res.headers.get( 'Last-Modified' )
+    etag    = res.headers.get( 'ETag' )
+    if lastMod or etag:
+      _cacheStore( url, lastMod, etag, res.data )
+    return res.data
+
   try:
-    res = urlopen( url )
+    res = urlopen( Request( url, headers = headers ) )
+  except HTTPError as err:
+    if err.code == 304 and cached:                                              # Page unchanged since last download; reuse cached body
+      return cached[2]
+    print(err)
+    return None
   except Exception as err:
     print(err)
     return None
@@ -53,6 +128,11 @@ def downloadPage( url = FORECAST_URL ):
     data = res.read()
   except Exception as err:
     print( err )
+  else:
+    lastMod = res.headers.get( 'Last-Modified' )
+    etag    = res.headers.get( 'ETag' )
+    if lastMod or etag:
+      _cacheStore( url, lastMod, etag, data )
 
   try:
     res.close()
@@ -65,78 +145,80 @@ def makeDate( txt, year ):
   tmp = list( map( int, txt.split('/') ) )
   return datetime( year, tmp[0], tmp[1] )
 
-def parseDates( cols, data, refDate ):
+def parseDates( texts, data, refDate ):
   key = 'date'
-  for i in range( 1, len(cols) ):
-    txt = cols[i].text
+  for txt in texts[1:]:
     if txt != '':
       newDate = makeDate( txt, refDate.year )
       if newDate.month < refDate.month:
         newDate = newDate.replace(year = newDate.year+1)
       refDate = newDate
-    data[ key ].append( refDate ) 
+    data[ key ].append( refDate )
   return refDate
 
-def parseHours( cols, data, offset ):
-  key = 'date'
-  for i in range( 1, len(cols) ):
-    hour = int( cols[i].text )
-    data[key][ offset ] = data[key][offset].replace( hour = hour ) 
-    offset += 1
-  
-  return offset
-
-def parseVar( cols, data ):
-  txt       = cols[0].text
-  var, unit = getVarName_Units( txt )
+def parseHours( texts, data ):
+  data['hour'].extend( int( txt ) for txt in texts[1:] )
+
+def parseVar( texts, data ):
+  var, unit = getVarName_Units( texts[0] )
   isWindDir = 'wind dir' in var.lower()
 
   if var not in data:
-    data[var] = {'units' : unit, 'values' : []}
+    data[var] = {'units' : unit, 'values' : array('d')}                         # C-doubles buffer; grows without boxing each value as a Python float
 
-  var = data[var]
-  key = 'values'
+  texts = texts[1:]
+  if isWindDir:
+    vals = numpy.fromiter(
+      ( WINDDIR_FAST.get( t.strip().upper(), _NAN ) for t in texts ),
+      dtype = numpy.float64, count = len(texts) )
+  else:
+    vals = numpy.fromiter(
+      ( int(t) if t.isdigit() else _NAN for t in texts ),
+      dtype = numpy.float64, count = len(texts) )
+
+  data[var]['values'].frombytes( vals.tobytes() )                               # Bulk append at C level; both sides are raw float64
 
-  for col in cols[1:]:
-    txt = col.text
-    if isWindDir:
-      var[key].append( WINDDIR.get( txt, numpy.nan) ) 
-    elif txt.isdigit():
-      var[key].append( int(txt) )
-    elif txt == '':
-      var[key].append( numpy.nan )
+@lru_cache( maxsize = 64 )
+def _parse_units( txt ):
+  """Memoized units.parse_units; the forecast tables reuse a handful of unit strings"""
+
+  return units.parse_units( txt )
 
 def getVarName_Units( txt ):
   tmp = txt.split('(')
   if len(tmp) == 2:
     var  = tmp[0].strip()
-    unit = units.parse_units( tmp[1][:-1] )
+    unit = _parse_units( tmp[1][:-1] )
   else:
     var  = txt
     if 'wind dir' in txt.lower():
-      unit = units.parse_units('degree')
+      unit = _parse_units('degree')
     else:
       unit = 1.0
   return var, unit
 
 def parseData( table, refDate, loc, update ):
-  data    = { 'date' : [], 'location' : loc, 'update' : update }
-  offset  = 0
+  data    = { 'date' : [], 'hour' : [], 'location' : loc, 'update' : update }
 
   for row in table.find_all('tr'):
-    cols = row.find_all('td')
-    txt = cols[0].text.lower()
+    texts = [ col.text for col in row.find_all('td') ]                          # Extract every cell's text once; helpers work on plain strings
+    txt   = texts[0].lower()
     if 'date' in txt:
-      refDate = parseDates( cols, data, refDate )
+      refDate = parseDates( texts, data, refDate )
     elif 'hour' in txt:
-      offset = parseHours( cols, data, offset )
+      parseHours( texts, data )
     elif txt != '':
-      parseVar( cols, data )
+      parseVar( texts, data )
+
+  data['date'] = (                                                              # Combine days and hours in one vectorized add; avoids a datetime.replace() per cell
+    numpy.array( data['date'],      dtype = 'datetime64[h]'  ) +
+    numpy.array( data.pop('hour'),  dtype = 'timedelta64[h]' )
+  )
 
   for key, val in data.items():
     if isinstance(val, dict):
-      vals = numpy.asarray( val['values'] ) * val['units']
-      data[key] = vals
+      vals = numpy.frombuffer( val['values'], dtype = numpy.float64 ).copy()    # Single typed buffer; copy so the result owns its memory
+      data[key] = vals * val['units']
 
   gst = 'Gust'
   srf = 'Surface Wind'
@@ -174,7 +256,7 @@ def getRefDate( col, fmt = '%H%p %a, %b %d %Y' ):
   txt = date[0].text
   return datetime.strptime( txt, fmt )
 
-def getNWSForecastData( url = FORECAST_URL, parser = 'html.parser' ):
+def getNWSForecastData( url = FORECAST_URL, parser = PARSER ):
   html = downloadPage( url )
   if html is None: return html
 
@@ -9,29 +9,25 @@ from os.path import splitext
 from io import BytesIO
 from zipfile import ZipFile
 
-from threading import Lock
- 
+from threading import RLock
+from concurrent.futures import ThreadPoolExecutor
+
 from .htmlUtils import urlJoin, downloadPage
 
 BASE_URL = 'https://www.spc.noaa.gov/'
-LOCK     = Lock()
+LOCK     = RLock()
 
-def threadSafe( func ):
-  def wrappedThreadSafe(*args, **kwargs):
-    with LOCK:
-      return func( *args, **kwargs )
-  return wrappedThreadSafe
+_HREF_RE = re.compile( rb'href="([^"]+\.zip)"' )                                # Compiled once; matches the raw bytes so the page is never decoded
 
 def findShapefile( day ):
   url  = urlJoin( BASE_URL, 'products', 'outlook', f'day{day}otlk.html' )
-  try:
-    html = downloadPage( url ).decode()
-  except:
+  html = downloadPage( url )
+  if html is None:
     return None
 
-  link = [ f for f in re.findall('href="([^"]+)"', html) if f.endswith('.zip')]
+  link = _HREF_RE.findall( html )
   if len(link) == 1:
-    return downloadPage( urlJoin( BASE_URL, link[0] ) )
+    return downloadPage( urlJoin( BASE_URL, link[0].decode() ) )                # Only the matched link needs decoding
   return None
 
 
@@ -45,56 +41,82 @@ class SPC_Shapefiles( object ):
     self._tornado       = {}
     self._wind          = {}
     self._hail          = {}
+    self._CATEGORIES    = (
+      ('Categorical',   self._categorical),
+      ('Probabilistic', self._probabilistic),
+      ('Tornado',       self._tornado),
+      ('Wind',          self._wind),
+      ('Hail',          self._hail),
+    )
+    self._lastResults   = None                                                  # Raw archive bytes from the previous getLatest(); used to detect change
 
     self.getLatest()
  
+  # Readers just grab the current dict reference, which is atomic under
+  # the GIL; getLatest() swaps in freshly built dicts under LOCK
   @property
-  @threadSafe
   def Categorical(self):
     return self._categorical
 
   @property
-  @threadSafe
   def Probabilistic(self):
     return self._probabilistic
 
   @property
-  @threadSafe
   def Tornado(self):
     return self._tornado
 
   @property
-  @threadSafe
   def Wind(self):
     return self._wind
 
   @property
-  @threadSafe
   def Hail(self):
     return self._hail
 
   def __getitem__(self, index):
-    out = {}
-    if index in self._categorical:
-      out['Categorical'  ] = self._categorical[   index]    
-    if index in self._probabilistic:
-      out['Probabilistic'] = self._probabilistic[ index]    
-    if index in self._tornado:
-      out['Tornado'      ] = self._tornado[       index]    
-    if index in self._wind:
-      out['Wind'         ] = self._wind[          index]    
-    if index in self._hail:
-      out['Hail'         ] = self._hail[          index]    
-    return out
-
-  @threadSafe
-  def getLatest( self ):
+    return { name : d[index] for name, d in self._CATEGORIES if index in d }
+
+  def getLatest( self, publish = True ):
+    """
+    Download the latest outlook archives
+
+    Keyword arguments:
+      publish (bool) : When True (default), swap the freshly built
+        shapefile dicts into place before returning. When False, the
+        built category tuple is returned without being published;
+        the caller hands it to publish() once any data derived from
+        it is ready, so readers never see the new dicts early
+
+    Returns:
+      When publish is True: bool; True when any day's archive differs
+        from the previous download, False when everything is
+        byte-for-byte unchanged, in which case the existing shapefile
+        dicts are left untouched.
+      When publish is False: the built category tuple, or None when
+        nothing changed
+
+    """
+
     self.log.debug('Getting latest data from SPC')
-    for day in range(1, 4): 
-      data = findShapefile( day )
+    with ThreadPoolExecutor( max_workers = 3 ) as ex:                           # Each day is an independent download; fetch all concurrently
+      results = list( ex.map( findShapefile, range(1, 4) ) )
+
+    if results == self._lastResults:                                            # Nothing new was issued; skip the rebuild entirely
+      self.log.debug( 'SPC data unchanged' )
+      return False if publish else None
+    self._lastResults = results
+
+    categorical   = {}                                                          # Build fresh dicts off-lock, then publish them atomically below
+    probabilistic = {}
+    tornado       = {}
+    wind          = {}
+    hail          = {}
+
+    for day, data in enumerate( results, start = 1 ):
       if data is None:
         self.log.warning( f'Failed to get SPC Shapefile archive for outlook day : {day}' )
-        continue 
+        continue
 
       with ZipFile( BytesIO( data ) ) as zz:
         fnames = zz.namelist()
@@ -104,18 +126,41 @@ class SPC_Shapefiles( object ):
             shp = fname
             dbf = f'{ref}.dbf'
             if dbf in fnames:
-              tmp = {'shp' : BytesIO(), 
-                     'dbf' : BytesIO()}
-              tmp['shp'].write( zz.read( shp) )
-              tmp['dbf'].write( zz.read( dbf) )
+              tmp = {'shp' : BytesIO( zz.read( shp ) ),                         # Wrap the decompressed bytes directly; no intermediate write() copy
+                     'dbf' : BytesIO( zz.read( dbf ) )}
               if ref.endswith('_cat'):
-                self._categorical[ day ] = tmp  
+                categorical[ day ] = tmp
               elif ref.endswith('_prob'):
-                self._probabilistic[ day ] = tmp
+                probabilistic[ day ] = tmp
               elif ref.endswith('_torn'):
-                self._tornado[ day ] = tmp  
+                tornado[ day ] = tmp
               elif ref.endswith('_wind'):
-                self._wind[ day ] = tmp  
+                wind[ day ] = tmp
               elif ref.endswith('_hail'):
-                self._hail[ day ] = tmp
- 
+                hail[ day ] = tmp
+
+    categories = (
+      ('Categorical',   categorical),
+      ('Probabilistic', probabilistic),
+      ('Tornado',       tornado),
+      ('Wind',          wind),
+      ('Hail',          hail),
+    )
+
+    if not publish:                                                             # Caller publishes later, once derived data is built alongside
+      return categories
+
+    self.publish( categories )
+    return True
+
+  def publish( self, categories ):
+    """Swap in freshly built shapefile dicts; readers see either the old or new set, never a mix"""
+
+    with LOCK:
+      self._categorical   = categories[0][1]
+      self._probabilistic = categories[1][1]
+      self._tornado       = categories[2][1]
+      self._wind          = categories[3][1]
+      self._hail          = categories[4][1]
+      self._CATEGORIES    = categories
+
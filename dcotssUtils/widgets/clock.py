@@ -11,12 +11,13 @@ CLOCKFONT = QFont('courier new', 36)
 CLOCKFONT.setBold( True )
 
 class Clock( QLabel ):
-  FMT = '%H:%M:%S'
+  FMT = '%H:%M'
   def __init__(self, *args, **kwargs):
     super().__init__(*args, **kwargs)
     self.setFont( CLOCKFONT )
     self._offset = ceil( (datetime.utcnow() - datetime.now()).total_seconds()/3600 )
-    self._offset = timedelta( hours = self._offset ) 
+    self._offset = timedelta( hours = self._offset )
+    self._lastMin = None
     self._updateClock()
 
     self._timer = QTimer()
@@ -27,7 +28,9 @@ class Clock( QLabel ):
     gmt = datetime.utcnow()
     lt  = gmt - self._offset
 
-    gmt = gmt.strftime( self.FMT )
-    lt  =  lt.strftime( self.FMT )
+    if gmt.minute != self._lastMin:                                             # Hour/minute text only changes on minute rollover; cache it
+      self._lastMin = gmt.minute
+      self._gmtBase = gmt.strftime( self.FMT )
+      self._ltBase  =  lt.strftime( self.FMT )
 
-    self.setText( f'{gmt} UTC<br>{lt} LT' )
+    self.setText( f'{self._gmtBase}:{gmt.second:02d} UTC<br>{self._ltBase}:{lt.second:02d} LT' )
@@ -0,0 +1,20 @@
+from qtpy.QtCore import QObject, QRunnable, Signal
+
+class FetchSignals( QObject ):
+  finished = Signal( object )
+
+class Fetcher( QRunnable ):
+  """Runs a blocking download function off the Qt main thread"""
+
+  def __init__(self, func):
+    super().__init__()
+    self.func    = func
+    self.signals = FetchSignals()
+
+  def run(self):
+    try:
+      data = self.func()
+    except Exception as err:
+      print( f'Failed to get data: {err}' )
+      data = None
+    self.signals.finished.emit( data )
@@ -4,8 +4,8 @@ from qtpy.QtWidgets import  QWidget, QLabel, QLineEdit, QGridLayout
 from qtpy.QtGui import QFont
 from qtpy.QtCore import Qt
 
-from .. import KM2KFT 
-from ..atmos import StandardAtmos
+from .. import KM2KFT
+from ..atmos import getStandardAtmos
 
 ALTFONT   = QFont( 'courier new', 14)
 
@@ -27,7 +27,7 @@ class HeightConverter( QWidget ):
   def __init__(self, *args, **kwargs):
     super().__init__(*args, **kwargs)
     self.log     = logging.getLogger(__name__)
-    self.atmos   = StandardAtmos()
+    self.atmos   = getStandardAtmos()
     self.oldVals = {}
 
     # Generate label objecs
@@ -55,6 +55,13 @@ class HeightConverter( QWidget ):
     # Make the temperature box read only
     self.temp.setReadOnly( True )
 
+    # Map keyword names to entry widgets so updateLabels() avoids getattr
+    self._fields = {'km'    : self.km,
+                    'kft'   : self.kft,
+                    'hPa'   : self.hPa,
+                    'temp'  : self.temp,
+                    'theta' : self.theta}
+
     # Connect methods to run when <Enter>/<Return> is pressed
     self.km.returnPressed.connect(    self.kmChanged )
     self.kft.returnPressed.connect(   self.kftChanged )
@@ -177,5 +184,4 @@ class HeightConverter( QWidget ):
 
     for key, val in kwargs.items():                                             # Iterate over all keywords
       self.oldVals[key] = val                                                   # If made this far, then update the oldVals to current values
-      txt = self.FMT.format(val)                                                # Format text
-      getattr(self, key).setText( txt )                                         # Get corresponding class attribute and call setText method
+      self._fields[key].setText( self.FMT.format(val) )                         # Look up corresponding entry widget and update its text
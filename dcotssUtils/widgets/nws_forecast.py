@@ -1,8 +1,9 @@
 import os
+import math
 import datetime as dt
 
 from qtpy.QtWidgets import QWidget, QLabel, QVBoxLayout
-from qtpy.QtCore import QTimer
+from qtpy.QtCore import QTimer, QThreadPool
 
 from matplotlib.backends.backend_qt5agg import FigureCanvas
 import matplotlib.dates as mplDates
@@ -10,26 +11,120 @@ from matplotlib.figure import Figure
 
 import numpy as np
 
-from metpy.calc import dewpoint_from_relative_humidity, wind_components
+from metpy.calc import dewpoint_from_relative_humidity
 from metpy.units import units
 
 from ..htmlUtils import getNWSForecastData
+from .fetcher import Fetcher
 
 DEFAULT_KWARGS = {'marker' : 'o', 'linestyle' : '-', 'linewidth' : 1, 'markersize' : 2}
+DEFAULT_GRID   = {'b'     : True,   'which'     : 'both', 'axis'      : 'both',
+                  'color' : 'gray', 'linestyle' : '-',    'linewidth' : 0.5}
+_DATE_FMT      = mplDates.DateFormatter( '%m/%d/%H' )                           # Immutable; shared across all panels instead of rebuilt per init
+_LEGEND_PROPS  = {'size' : 9}
+MAX_ANNOT      = 150                                                            # Annotations per panel: 3 variables at every 3rd point of a ~150 h forecast
+
+DISPLAY_UNITS  = {                                                              # Units each variable is plotted in; conversion happens once at ingest
+  'Temperature'             : units.degF,
+  'Dewpoint'                : units.degF,
+  'Heat Index'              : units.degF,
+  'Surface Wind'            : 'knots',
+  'Gust'                    : 'knots',
+  'Wind Dir'                : 'degree',
+  'Relative Humidity'       : units.percent,
+  'Precipitation Potential' : units.percent,
+  'Sky Cover'               : units.percent,
+}
+
+def getForecastData( url = None ):
+  """
+  getNWSForecastData() with pint Quantities converted to display units
+
+  Converting here, once per download, leaves the plot path pure numpy;
+  pint's registry walk in .to() is off the per-replot cost entirely.
+
+  """
+
+  data = getNWSForecastData() if url is None else getNWSForecastData( url )
+  if data is None:
+    return data
+
+  for key, unit in DISPLAY_UNITS.items():
+    if key in data:
+      data[key] = _magnitude( data[key], unit )
+  return data
 DEGSYM         = u'\xb0'
 
 def calc_mslp(t, p, h):
     return p * (1 - (0.0065 * h) / (t + 0.0065 * h + 273.15)) ** (-5.257)
 
+try:                                                                            # Same optional-numba pattern as atmos; fuses the expression into one loop on arrays
+  from numba import njit
+except ImportError:
+  pass
+else:
+  calc_mslp = njit( cache = True, fastmath = True )( calc_mslp )
+
+def _magnitude( quant, unit ):
+  """Contiguous float64 values of quant in unit; plain arrays pass through cheaply
+
+  Returning C-contiguous float64 makes set_data()'s internal asarray a
+  no-op reference assignment; for arrays already in that form this is
+  a dtype/flags check, not a copy.
+
+  """
+
+  if hasattr( quant, 'to' ):
+    quant = quant.to( unit ).magnitude
+  return np.ascontiguousarray( quant, dtype = np.float64 )
+
+def _m4( x, y, width ):
+  """
+  M4 downsample of a series to ~4 points per pixel column
+
+  Keeps the first, minimum, maximum, and last sample of each pixel bin,
+  which is visually lossless for a line plot narrower than the data.
+  The min/max are placed at the bin midpoint; for downsampling purposes
+  their sub-pixel position is irrelevant.
+
+  """
+
+  edges  = np.linspace( x[0], x[-1], width + 1 )
+  starts = np.unique( np.searchsorted( x, edges[:-1] ) )                        # unique() drops empty bins so reduceat segments are valid
+  starts = starts[ starts < len(y) ]
+  ends   = np.append( starts[1:], len(y) )
+  mids   = (x[starts] + x[ends-1]) / 2.0
+
+  xs = np.empty( starts.size * 4 )
+  ys = np.empty( starts.size * 4 )
+  xs[0::4] = x[starts]
+  xs[1::4] = mids
+  xs[2::4] = mids
+  xs[3::4] = x[ends-1]
+  ys[0::4] = y[starts]
+  ys[1::4] = np.minimum.reduceat( y, starts )
+  ys[2::4] = np.maximum.reduceat( y, starts )
+  ys[3::4] = y[ends-1]
+  return xs, ys
+
+def _wind_components( ws, wd ):
+  """U/V components from plain speed and direction (degrees) arrays
+
+  Same math as metpy.calc.wind_components, minus the pint unit dispatch
+  that dominated the cost for these small arrays.
+
+  """
+
+  rad = np.deg2rad( wd )
+  return -ws * np.sin( rad ), -ws * np.cos( rad )
+
 def roundUp( val, n=None ):
-  tmp = round(val, n)
-  if tmp < val: tmp += 10**(-n)
-  return tmp
+  f = 10.0**(-n) if n else 1.0
+  return math.ceil( val / f ) * f
 
 def roundDown( val, n=None ):
-  tmp = round(val, n)
-  if tmp > val: tmp -= 10**(-n)
-  return tmp
+  f = 10.0**(-n) if n else 1.0
+  return math.floor( val / f ) * f
  
 # Make meteogram plot
 class Meteogram( FigureCanvas ):
@@ -61,56 +156,95 @@ class Meteogram( FigureCanvas ):
     self.winds  = None
     self.probs  = None
 
+    self._lastLims    = None                                                    # Axis limits at last full render; invalidated to force a full redraw
+    self._barbKey     = None                                                    # Quantized winds behind the current barb paths; see plot_winds()
+    self._layoutDirty = True                                                    # tight_layout() is costly; run it only when the layout could have changed
+    self.mpl_connect( 'draw_event', self._onDraw )
+
     if data is not None: self.replot( data )
 #    self.dates = mpl.dates.date2num(dates)
 #    self.time = time.strftime('%Y-%m-%d %H:%M UTC')
 #    self.title = f'Latest Ob Time: {self.time}\nProbe ID: {probeid}'
     self.show()
 
+  @property
+  def subplots(self):
+    return [ info for info in (self.thermo, self.winds, self.probs) if info is not None ]
+
   @property
   def dates(self):
     return self._dates
 
   @dates.setter
   def dates(self, val):
-    self._dates = mplDates.date2num( val )
-    self.start  = val[ 0]
-    self.end    = val[-1]
+    if val is getattr( self, '_datesSrc', None ):                               # Same array as the previous replot; keep the cached date2num result
+      return
+    self._datesSrc = val
+    self._dates    = mplDates.date2num( val )
+    self.start     = val[ 0]
+    self.end       = val[-1]
+
+  def _decimate(self, y):
+    """Dates/values pair for plotting, M4-downsampled when y far exceeds the pixel width"""
+
+    width = int( self.figure.get_size_inches()[0] * self.figure.dpi )
+    if len( y ) > 4 * width:
+      return _m4( self.dates, y, width )
+    return self.dates, y
 
   def addGrid(self, axis, **kwargs):
-    axis.grid(
-      b         = kwargs.get('b',         True), 
-      which     = kwargs.get('which',     'both'),
-      axis      = kwargs.get('axis',      'both'),
-      color     = kwargs.get('color',     'gray'),
-      linestyle = kwargs.get('linestyle', '-'),
-      linewidth = kwargs.get('linewidth', 0.5)
-    )
+    axis.grid( **{**DEFAULT_GRID, **kwargs} if kwargs else DEFAULT_GRID )       # Merge only when the defaults are actually overridden
 
   def addLegend( self, axis ):
-    axis.legend(loc='upper right', ncol=3, prop={'size': 9})
+    axis.legend(loc='upper right', ncol=3, prop=_LEGEND_PROPS)
 
   def addDates( self, axis ):
-    axis.xaxis.set_major_formatter(
-      mplDates.DateFormatter('%m/%d/%H')
-  )
+    axis.xaxis.set_major_formatter( _DATE_FMT )
+
+  def _initText(self, ax):
+    """
+    Preallocated pool of hidden annotation artists for one panel
+
+    The forecast length is bounded, so the pool is built once at panel
+    init; addAnnotations() then only updates text/position/visibility
+    instead of churning the artist list every replot.
+
+    """
+
+    texts = [
+      ax.annotate( '', (0, 0), fontsize = 'small', horizontalalignment = 'center' )
+      for _ in range( MAX_ANNOT )
+    ]
+    for txt in texts:
+      txt.set_animated( True )                                                  # Dynamic artists are excluded from full draws and blitted on top
+      txt.set_visible( False )
+    return texts
 
   def addAnnotations(self, subplot, fmt, *variables):
-    while len(subplot['text']) > 0:
-      subplot['text'].pop().remove()
-    for var in variables: 
+    texts = subplot['text']                                                     # Persistent Text artists; update in place rather than remove/recreate
+    n     = 0
+    for var in variables:
       for i in range(2, len(var), 3):
-        subplot['text'].append(
-          subplot['axes'].annotate(
+        if n < len(texts):
+          txt = texts[n]
+          txt.set_text( fmt.format( var[i] ) )
+          txt.set_position( (self.dates[i], var[i]) )
+          txt.set_visible( True )
+        else:
+          txt = subplot['axes'].annotate(
             fmt.format( var[i] ), (self.dates[i], var[i]),
             fontsize = 'small',
             horizontalalignment = 'center'
           )
-        )
+          txt.set_animated( True )                                              # Dynamic artists are excluded from full draws and blitted on top
+          texts.append( txt )
+        n += 1
+    for txt in texts[n:]:                                                       # Hide any leftovers from a longer previous forecast
+      txt.set_visible( False )
 
   def _init_winds(self, ws, wsmax, u, v):
     ax         = self.figure.add_subplot(4, 1, 2)
-    self.winds = {'axes' : ax, 'text' : []}
+    self.winds = {'axes' : ax, 'text' : self._initText( ax )}
     self.addGrid( ax )
 
     ln1  = ax.plot( self.dates, ws,    color='purple',   label='Wind Speed',  **DEFAULT_KWARGS)[0]
@@ -120,6 +254,9 @@ class Meteogram( FigureCanvas ):
     self.addLegend( ax )
     self.addDates(  ax )
 
+    for artist in (ln1, ln2, ln3):
+      artist.set_animated( True )
+
     self.winds.update( {'wind' : ln1, 'barbs' : ln3, 'gust' : ln2} )
 
   def plot_winds(self, ws, wd, wsmax):
@@ -132,30 +269,38 @@ class Meteogram( FigureCanvas ):
           plot_range: Data range for making figure (list of (min,max,step))
       """
 
-      ws    = ws.to('knots')
-      wsmax = wsmax.to('knots')
-      u, v  = wind_components( ws, wd ) 
+      ws    = _magnitude( ws,    'knots'  )
+      wsmax = _magnitude( wsmax, 'knots'  )
+      wd    = _magnitude( wd,    'degree' )
+      u, v  = _wind_components( ws, wd )
 
-      ws    = ws.magnitude
-      wsmax = wsmax.magnitude
-
-      pMax = np.nanmax( wsmax )
-      if not np.isfinite( pMax ):
-        pMax = ws.max()
+      pMax = np.nanmax( np.stack( [ws, wsmax] ) )                               # Covers the all-NaN gust case without a separate fallback branch
       prange = [-10, roundUp(pMax, -1)+10, 10]
 
       # PLOT WIND SPEED AND WIND DIRECTION
       if self.winds is None:
         self._init_winds(ws, wsmax, u, v)
       else:
-        self.winds['wind' ].set_data( self.dates, ws )
-        try:
-          self.winds['barbs'].remove()#set_data( self.dates, ws, u, v)
-        except:
-          pass
-        else:
-          self.winds['barbs'] = self.winds['axes'].barbs(self.dates, ws, u, v )
-        self.winds['gust' ].set_data( self.dates, wsmax)
+        self.winds['wind' ].set_data( *self._decimate( ws ) )
+        self.winds['gust' ].set_data( *self._decimate( wsmax ) )
+
+        barbs   = self.winds['barbs']
+        offsets = np.column_stack( [self.dates, ws] )
+        barbKey = (                                                             # Winds binned to 16 compass sectors and 5-kt speed buckets; barbs
+          np.nan_to_num( np.round( wd / 22.5 ) % 16 ).astype( np.int8 ).tobytes() +
+          np.nan_to_num( np.round( ws /  5.0 )      ).astype( np.int8 ).tobytes()
+        )                                                                       # are visually identical within a bin, so set_UVC() can be skipped
+        if len( offsets ) == len( barbs.get_offsets() ):                        # Same point count; update the existing collection in place
+          barbs.set_offsets( offsets )
+          if barbKey != self._barbKey:                                          # set_UVC() rebuilds every barb path; only pay for it on a visible change
+            barbs.set_UVC( u, v )
+            self._barbKey = barbKey
+        else:                                                                   # Point count changed; the collection must be rebuilt
+          barbs.remove()
+          barbs = self.winds['axes'].barbs( self.dates, ws, u, v )
+          barbs.set_animated( True )
+          self.winds['barbs'] = barbs
+          self._barbKey       = barbKey
       self.addAnnotations( self.winds, '{:0.0f}', ws )
 
       self.winds['axes'].set_ylim( *prange )
@@ -163,7 +308,7 @@ class Meteogram( FigureCanvas ):
 
   def _init_thermo( self, t, td, heat ):
     ax          = self.figure.add_subplot(4, 1, 1 )#, sharex=self.ax1)
-    self.thermo = {'axes' : ax, 'text' : []}
+    self.thermo = {'axes' : ax, 'text' : self._initText( ax )}
     self.addGrid( ax )
 
     ln1 = ax.plot(self.dates, t,    color='red',    label=f'Temperature ({DEGSYM}F)', **DEFAULT_KWARGS)[0]
@@ -173,6 +318,9 @@ class Meteogram( FigureCanvas ):
     self.addDates( ax )
     self.addLegend( ax )
 
+    for artist in (ln1, ln2, ln3):
+      artist.set_animated( True )
+
     self.thermo.update( {'t' : ln1, 'td' : ln2, 'heat' : ln3} )
 
   def plot_thermo(self, t, td, heat):
@@ -185,25 +333,22 @@ class Meteogram( FigureCanvas ):
     """
 
     # Force units to degrees F
-    t    = t.to(    units.degF ).magnitude 
-    td   = td.to(   units.degF ).magnitude
-    heat = heat.to( units.degF ).magnitude
-
-    pMin, pMax = np.inf, -np.inf
-    for i in [t, td, heat]:
-      iMin = np.nanmin( i )
-      iMax = np.nanmax( i )
-      if iMin < pMin: pMin = iMin 
-      if iMax > pMax: pMax = iMax
-    prange = [roundDown(pMin, -1), roundUp(pMax, -1)+10, 10]
+    t    = _magnitude( t,    units.degF )
+    td   = _magnitude( td,   units.degF )
+    heat = _magnitude( heat, units.degF )
+
+    stacked = np.stack( [t, td, heat] )                                         # One buffer, one pass for each reduction
+    pMin    = np.nanmin( stacked )
+    pMax    = np.nanmax( stacked )
+    prange  = [roundDown(pMin, -1), roundUp(pMax, -1)+10, 10]
 
     # PLOT TEMPERATURE AND DEWPOINT
     if self.thermo is None:
       self._init_thermo( t, td, heat )
     else:
-      self.thermo['t'   ].set_data(self.dates, t)
-      self.thermo['td'  ].set_data(self.dates, td)
-      self.thermo['heat'].set_data(self.dates, heat)
+      self.thermo['t'   ].set_data( *self._decimate(t) )
+      self.thermo['td'  ].set_data( *self._decimate(td) )
+      self.thermo['heat'].set_data( *self._decimate(heat) )
     self.addAnnotations( self.thermo, '{:0.0f}'+DEGSYM, t, td, heat )
 
     self.thermo['axes'].set_ylim( *prange )
@@ -211,7 +356,7 @@ class Meteogram( FigureCanvas ):
 
   def _init_probs( self, rh, precip, sky):
     ax          = self.figure.add_subplot(4, 1, 3 )#, sharex=self.ax1)
-    self.probs  = {'axes' : ax, 'text' : []}
+    self.probs  = {'axes' : ax, 'text' : self._initText( ax )}
     self.addGrid( ax )
 
     ln1 = ax.plot(self.dates, rh,     color='green', label='Relative Humidity',       **DEFAULT_KWARGS)[0]
@@ -222,21 +367,24 @@ class Meteogram( FigureCanvas ):
     self.addDates(  ax )
     self.addLegend( ax )
 
+    for artist in (ln1, ln2, ln3):
+      artist.set_animated( True )
+
     self.probs.update( {'rh' : ln1, 'precip' : ln2, 'sky' : ln3} )
 
 
   def plot_probs(self, rh, precip, sky):
 
-    rh     = rh.to(     units.percent ).magnitude
-    precip = precip.to( units.percent ).magnitude
-    sky    = sky.to(    units.percent ).magnitude
+    rh     = _magnitude( rh,     units.percent )
+    precip = _magnitude( precip, units.percent )
+    sky    = _magnitude( sky,    units.percent )
 
     if self.probs is None:
       self._init_probs( rh, precip, sky )
     else:
-      self.probs['rh'    ].set_data(self.dates, rh)
-      self.probs['precip'].set_data(self.dates, precip)
-      self.probs['sky'   ].set_data(self.dates, sky)
+      self.probs['rh'    ].set_data( *self._decimate(rh) )
+      self.probs['precip'].set_data( *self._decimate(precip) )
+      self.probs['sky'   ].set_data( *self._decimate(sky) )
 
     self.addAnnotations( self.probs, '{:0.0f}%', rh, precip, sky )
 
@@ -244,16 +392,79 @@ class Meteogram( FigureCanvas ):
 
 
   def replot(self, data):
+    label = ( data['location'], data['update'],
+              len( data['date'] ), tuple( data['date'][[0, -1]] ) )
+    if label == getattr( self, '_lastLabel', None ):                            # Upstream forecast has not changed; skip the whole replot
+      return
+    self._lastLabel = label
+
     self.dates = data['date']
-    self.figure.suptitle( data['location'], fontsize=12 )
+    if data['location'] != getattr( self, '_lastLoc', None ):                   # A new title can change the layout; flag it for the next full render
+      self._lastLoc     = data['location']
+      self._layoutDirty = True
+      self.figure.suptitle( data['location'], fontsize=12 )
     self.plot_thermo( data['Temperature'], data['Dewpoint'], data['Heat Index'] )
     self.plot_winds( data['Surface Wind'], data['Wind Dir'], data['Gust'] )
     self.plot_probs( data['Relative Humidity'], data['Precipitation Potential'], data['Sky Cover'] )
 
-    for info in [self.thermo, self.winds, self.probs]:
+    for info in self.subplots:
       info['axes'].set_xlim(self.start, self.end)
-    self.figure.tight_layout()
-    self.draw()
+
+    self._refresh()
+
+  def _dynamicArtists(self, info):
+    """Artists of a subplot that change between replots and get blitted"""
+
+    artists = [ val for key, val in info.items() if key not in ('axes', 'text', 'bg') ]
+    return artists + info['text']
+
+  def _onDraw(self, *args):
+    """
+    Runs after every full render of the figure
+
+    Any full draw -- ours or one triggered by Qt on resize/expose --
+    leaves the static content in the buffer, so recapture the per-axes
+    backgrounds here and paint the animated artists on top.
+
+    """
+
+    for info in self.subplots:
+      info['bg'] = self.copy_from_bbox( info['axes'].bbox )
+      for artist in self._dynamicArtists( info ):
+        info['axes'].draw_artist( artist )
+
+  def _refresh(self):
+    """
+    Render the canvas, blitting when only the data changed
+
+    When the axis limits match the previous render, the cached per-axes
+    backgrounds are restored and only the animated artists (lines,
+    barbs, annotations) are redrawn. Otherwise a full render is queued
+    with draw_idle() -- letting Qt coalesce it with any other pending
+    redraws -- and _onDraw() recaptures the backgrounds when it lands.
+
+    """
+
+    subplots = self.subplots
+    if len(subplots) == 0:
+      return
+
+    lims = [ (info['axes'].get_xlim(), info['axes'].get_ylim()) for info in subplots ]
+    if lims != self._lastLims or any( 'bg' not in info for info in subplots ):
+      if lims != self._lastLims:                                                # New limits can widen tick labels; margins must be recomputed
+        self._layoutDirty = True
+      self._lastLims = lims
+      if self._layoutDirty:
+        self.figure.tight_layout()
+        self._layoutDirty = False
+      self.draw_idle()
+      return
+
+    for info in subplots:
+      self.restore_region( info['bg'] )                                         # Static content is unchanged; repaint it from the cache
+      for artist in self._dynamicArtists( info ):
+        info['axes'].draw_artist( artist )
+    self.blit( self.figure.bbox )
 
 class NWS_Forecast( QWidget ):
 
@@ -265,6 +476,7 @@ class NWS_Forecast( QWidget ):
     self.fig      = Meteogram( data = data )
     self.update   = QLabel()
     self.download = QLabel()
+    self._closed  = False
 
     self._update()
 
@@ -282,13 +494,19 @@ class NWS_Forecast( QWidget ):
     self.show()
 
   def _update(self):
-    try:
-      data = getNWSForecastData()
-    except Exception as err:
-      print( f'Failed to get data: {err}' )
+    fetcher = Fetcher( getForecastData )                                        # Download runs in the global thread pool; GUI thread only replots
+    fetcher.signals.finished.connect( self._on_data )
+    QThreadPool.globalInstance().start( fetcher )
+
+  def _on_data(self, data):
+    if self._closed or data is None:                                            # Widget closed while fetching, or the fetch failed
       return
     self.fig.replot( data )
     utc = dt.datetime.utcnow().strftime( '%I:%M %p UTC %b %d, %Y' )
     self.update.setText( data['update'] )
     self.download.setText( f'Download time: {utc}' )
 
+  def closeEvent(self, event):
+    self._closed = True
+    super().closeEvent( event )
+
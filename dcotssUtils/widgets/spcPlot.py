@@ -1,37 +1,153 @@
 import logging
 
-import re
+import os
+import pickle
 from datetime import datetime, timedelta
+from functools import lru_cache
 from itertools import chain
+from threading import Lock
 
 from qtpy.QtWidgets import QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QGridLayout
 from qtpy.QtGui import QFont
-from qtpy.QtCore import Qt, QTimer
+from qtpy.QtCore import Qt, QTimer, QThreadPool
 
 from matplotlib.backends.backend_qt5agg import FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
+import numpy
+
 from matplotlib.figure import Figure
 from matplotlib.patches import Patch
+from matplotlib.path import Path
+from matplotlib.collections import PathCollection
 
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 import cartopy.io.shapereader as shpreader
 
 from shapefile import Reader
+import shapely
 from shapely.geometry import Polygon
-from descartes import PolygonPatch
+from shapely.prepared import prep
+from shapely.strtree import STRtree
+
+_SHAPELY2 = hasattr( shapely, 'get_coordinates' )                               # shapely 2 exposes vectorized ufuncs over geometry arrays
 
 from ..spcUtils import SPC_Shapefiles
+from .fetcher import Fetcher
   
 EXTENT     = [-120, -72, 20, 50]
-RESOLUTION = '50m'
 WATER      = [0.78823529, 0.8745098 , 0.94509804]
 NOT_USA    = [0.75] * 3
 
-FLOAT      = re.compile( '\d+\.?\d*' )
 DATEFMT    = '%Y%m%d%H%M'
 
+CACHE_DIR  = os.path.join( os.path.expanduser('~'), '.cache', 'dcotssUtils' )   # On-disk cache for derived geometry data
+_GEOM_LOCK = Lock()                                                             # Serializes the build/load path of the geometry caches below
+
+def resolutionForSpan( span ):
+  """natural_earth resolution appropriate for a lon/lat span in degrees"""
+
+  if span > 40: return '110m'
+  if span > 10: return '50m'
+  return '10m'
+
+@lru_cache( maxsize = 3 )
+def nonUSGeoms( resolution, extent ):
+  """
+  Geometries of non-US countries intersecting the map domain
+
+  Filtering the full natural_earth country shapefile dominates canvas
+  setup, yet the result depends only on resolution and extent; cache it
+  in memory for repeat widget construction and on disk across runs.
+
+  Arguments:
+    resolution (str)   : natural_earth resolution; e.g., '50m'
+    extent     (tuple) : Map domain as (lon0, lon1, lat0, lat1)
+
+  Returns:
+    tuple : Shapely geometries for every matching country
+
+  """
+
+  with _GEOM_LOCK:                                                              # One builder at a time; losers find the lru/pickle caches warm
+    cacheFile = os.path.join( CACHE_DIR, f'non_us_geoms_{resolution}.pkl' )
+    try:
+      with open( cacheFile, 'rb' ) as fid:
+        cached = pickle.load( fid )
+      if cached[0] == extent:                                                   # Guard against a cache written for a different domain
+        return cached[1]
+    except Exception:
+      pass
+
+    shpfilename = shpreader.natural_earth(resolution=resolution,
+                                          category='cultural',
+                                          name='admin_0_countries')             # Get path to cartopy shape file file cultural boundaries
+    reader  = shpreader.Reader(shpfilename)                                     # Open the shape file
+    extPoly = Polygon.from_bounds( extent[0], extent[2], extent[1], extent[3] ) # Generate polygon using the extent of the map
+    extPrep = prep( extPoly )                                                   # Prepared once; bbox short-circuit plus cached GEOS graph per query
+    records = list( reader.records() )
+    tree    = STRtree( [ country.geometry for country in records ] )            # R-tree prune; only countries whose bbox touches the domain get an exact test
+    if _SHAPELY2:
+      index = tree.query( extPoly )                                             # shapely 2 returns indices into the input list
+    else:
+      byId  = { id(country.geometry) : i for i, country in enumerate(records) } # shapely 1.x returns the geometries themselves; map back by identity
+      index = [ byId[ id(geom) ] for geom in tree.query( extPoly ) ]
+    geoms   = tuple(
+      records[i].geometry
+      for i in index
+      if records[i].attributes['NAME'] != 'United States of America'
+        and extPrep.intersects( records[i].geometry )
+    )
+    reader.close()
+
+    try:
+      os.makedirs( CACHE_DIR, exist_ok = True )
+      with open( cacheFile, 'wb' ) as fid:
+        pickle.dump( (extent, geoms), fid )
+    except Exception as err:
+      logging.getLogger(__name__).warning( f'Failed to cache geometries: {err}' )
+
+    return geoms
+
+@lru_cache( maxsize = None )
+def featureGeoms( name, resolution ):
+  """
+  Geometries of a named cartopy feature, cached in memory and on disk
+
+  add_feature() re-reads and re-parses the natural_earth shapefile on
+  the first draw of every session; unpickling the shapely geometries is
+  far faster and, like nonUSGeoms(), only the first ever run pays the
+  shapefile cost.
+
+  Arguments:
+    name       (str) : cartopy.feature attribute name; e.g., 'OCEAN'
+    resolution (str) : natural_earth resolution; e.g., '50m'
+
+  Returns:
+    tuple : Shapely geometries of the feature
+
+  """
+
+  with _GEOM_LOCK:                                                              # One builder at a time; losers find the lru/pickle caches warm
+    cacheFile = os.path.join( CACHE_DIR, f'{name.lower()}_{resolution}.pkl' )
+    try:
+      with open( cacheFile, 'rb' ) as fid:
+        return pickle.load( fid )
+    except Exception:
+      pass
+
+    geoms = tuple( getattr( cfeature, name ).with_scale( resolution ).geometries() )
+
+    try:
+      os.makedirs( CACHE_DIR, exist_ok = True )
+      with open( cacheFile, 'wb' ) as fid:
+        pickle.dump( geoms, fid )
+    except Exception as err:
+      logging.getLogger(__name__).warning( f'Failed to cache geometries: {err}' )
+
+    return geoms
+
 def flip(items, ncol):
   """Flip data for legend so fills across row instead of down column"""
 
@@ -43,11 +159,136 @@ def convert2Percent(val):
 
   """
 
-  if FLOAT.match( val ):                                                        # If val matches the FLOAT regex pattern
-    return str(int(float(val)*100))                                             # Convert val to float, multiply by 100, convert to int, convert to string
-  return val                                                                    # Just return val
+  try:                                                                          # float() is a C builtin; far cheaper than a regex match per record
+    return str( int( float(val) * 100 ) )                                       # Convert val to float, multiply by 100, convert to int, convert to string
+  except ValueError:                                                            # Non-numeric label; e.g., 'TSTM' or 'SIGN'
+    return val                                                                  # Just return val
+
+@lru_cache( maxsize = 1024 )
+def parseDate( val ):
+  """
+  Parse a DATEFMT (YYYYMMDDHHMM) string into a datetime
+
+  The format is fixed-width numeric, so one int() conversion plus
+  arithmetic decomposition replaces datetime.strptime() and its
+  pure-Python format interpreter; called three times per shapefile
+  record. Every record of an outlook shares the same
+  VALID/EXPIRE/ISSUE stamps, so the cache collapses those to one parse
+  apiece.
+
+  """
+
+  n         = int( val )
+  n, minute = divmod( n, 100 )
+  n, hour   = divmod( n, 100 )
+  n, day    = divmod( n, 100 )
+  year, month = divmod( n, 100 )
+  return datetime( year, month, day, hour, minute )
 
-def parseRecord(fields, record):
+def simplifyRing( ring, tol ):
+  """
+  Ring with redundant vertices removed
+
+  Cartopy projects every vertex through PROJ in a Python loop, so vertex
+  reduction feeds straight through to draw time. Rings too short to
+  simplify pass through unchanged.
+
+  """
+
+  if len( ring ) < 5:
+    return ring
+  return list( Polygon( ring ).simplify( tol, preserve_topology = True ).exterior.coords )
+
+def simplifyRings( rings, tol ):
+  """
+  Simplify many rings at once
+
+  On shapely 2 the whole batch goes through three vectorized calls --
+  linearrings(), simplify(), get_coordinates() -- i.e., one GEOS
+  dispatch for the shapefile instead of one per ring. Shapely 1.x, or
+  any geometry the bulk path rejects, falls back to simplifyRing().
+
+  """
+
+  if len( rings ) < 2 or not _SHAPELY2:
+    return [ simplifyRing( ring, tol ) for ring in rings ]
+
+  try:
+    coords = numpy.concatenate( rings )
+    index  = numpy.repeat( numpy.arange( len(rings) ),
+                           [ len(ring) for ring in rings ] )
+    geoms  = shapely.linearrings( coords, indices = index )
+    geoms  = shapely.simplify( geoms, tol, preserve_topology = True )
+    coords, index = shapely.get_coordinates( geoms, return_index = True )
+    splits = numpy.searchsorted( index, numpy.arange( 1, len(rings) ) )
+    return numpy.split( coords, splits )
+  except Exception:                                                             # e.g., an unclosed/degenerate ring the bulk constructor rejects
+    return [ simplifyRing( ring, tol ) for ring in rings ]
+
+# Maps a shapefile field name to the output key it fills and the parser
+# for its value; one dict lookup replaces the if/elif chain per field
+_FIELD_HANDLERS = {
+  'VALID'  : ('start',     parseDate),
+  'EXPIRE' : ('end',       parseDate),
+  'ISSUE'  : ('issued',    parseDate),
+  'LABEL'  : ('label',     convert2Percent),
+  'stroke' : ('edgecolor', None),
+  'fill'   : ('facecolor', None),
+}
+
+def fieldHandlers( fields ):
+  """
+  (record index, output key, parser) for each field of interest
+
+  Only fields present in _FIELD_HANDLERS appear, so parseRecord() visits
+  the handful of fields it uses rather than scanning every field of
+  every record.
+
+  """
+
+  handlers = []
+  for i, field in enumerate( fields ):
+    handler = _FIELD_HANDLERS.get( field )
+    if handler is not None:
+      handlers.append( (i - 1, *handler) )                                      # Record values lag the field list by one; fields[0] is the deletion flag
+  return handlers
+
+def projectRings( rings, projection ):
+  """
+  Project PlateCarree rings into the target map projection
+
+  Done once at parse time so draws hand matplotlib pre-projected
+  vertices through transData, keeping PROJ out of the render path.
+  Every ring goes through a single vectorized transform_points() call.
+
+  """
+
+  if len( rings ) == 0:
+    return rings
+  coords = numpy.concatenate( rings )
+  coords = projection.transform_points(
+    ccrs.PlateCarree(), coords[:, 0], coords[:, 1] )[:, :2]
+  splits = numpy.cumsum( [ len(ring) for ring in rings[:-1] ] )
+  return numpy.split( coords, splits )
+
+def compoundPath( rings ):
+  """
+  Single matplotlib Path spanning all rings of one record
+
+  A MOVETO code opens each ring, so interior rings render as holes;
+  this is what descartes' PolygonPatch produced by walking
+  __geo_interface__ in Python, built here straight from the arrays.
+
+  """
+
+  verts  = numpy.concatenate( rings )
+  codes  = numpy.full( len(verts), Path.LINETO, dtype = Path.code_type )
+  starts = numpy.cumsum(
+    [ 0, *(len(ring) for ring in rings[:-1]) ] )                                # First vertex of each ring; fancy indexing replaces the per-ring Python loop
+  codes[starts] = Path.MOVETO
+  return Path( verts, codes )
+
+def parseRecord(handlers, record):
   """
   Parse information from shapefile record
 
@@ -55,35 +296,24 @@ def parseRecord(fields, record):
   from a recond in the shape file
 
   Arguments:
-    fields (list) : Field names
-    record (list) : Record information
+    handlers (list) : (record index, key, parser) tuples from
+      fieldHandlers()
+    record   (list) : Record information
 
   Returns:
-    tuple : starting datetime, ending datetime, issued datetime, dict of 
+    tuple : starting datetime, ending datetime, issued datetime, dict of
       other informaiton
 
   """
 
-  start = end = issued = None                                                   # Initialize start, end, and issued to None
   out = {}                                                                      # Emtpy dict
-  for ID, field in enumerate( fields ):                                         # Iterate over all fields
-    key = None                                                                  # Set key to None by default
-    val = record[ID-1]                                                          # Set val to record that corresponds with field
-    if field == 'VALID':                                                        # If field is VALID
-      start = datetime.strptime(val, DATEFMT)                                   # Parse start time
-    elif field == 'EXPIRE':
-      end = datetime.strptime(val, DATEFMT)                                     # Parse end time
-    elif field == 'ISSUE':
-      issued = datetime.strptime(val, DATEFMT)                                  # Parse issued time
-    elif field == 'LABEL':
-      key = 'label'                                                             # Set key value
-      val = convert2Percent( val )                                              # Update val value
-    elif field == 'stroke':
-      key = 'edgecolor'                                                         # Set key val
-    elif field == 'fill':
-      key = 'facecolor'                                                         # Set key val
-    if key:                                                                     # If the key is set
-      out[key] = val                                                            # Add value to the out dict
+  for ID, key, func in handlers:                                                # Only the fields we use; indices resolved once by fieldHandlers()
+    val      = record[ID]                                                       # Set val to record that corresponds with field
+    out[key] = func( val ) if func else val
+
+  start  = out.pop('start',  None)
+  end    = out.pop('end',    None)
+  issued = out.pop('issued', None)
 
   label = out.get('label', None)
   if label == 'SIGN':
@@ -109,6 +339,10 @@ class ShapeReader( Reader ):
 
 class SPCWidget( SPC_Shapefiles, QWidget ):
 
+  SIMPLIFY_TOL = 0.02                                                           # Degrees (~2 km); well below outlook fidelity. Set falsy to disable
+
+  ISSUANCE_UTC = (100, 600, 1300, 1630, 2000)                                   # Nominal day-1 outlook issuance times (HHMM UTC), ascending
+
   PLOT_OPTS    = {
     'Categorical'   : {'ncol' : 3},
     'Probabilistic' : {'ncol' : 6, 'minProb' : 5},
@@ -124,8 +358,8 @@ class SPCWidget( SPC_Shapefiles, QWidget ):
     
 
     self.ax           = None                                                    # Will be used to reference map axes later
-    self.artists      = []                                                      # List to store all matploblib artists that will be updated
-    self.dayButtons   = {}                                                      # Dictionary to hold references to buttons to change outlook day
+    self._closed      = False                                                   # Set on close; in-flight fetch results are dropped instead of redrawn
+    self._parsedCache = {}                                                      # Parsed shapefile data keyed on (outlookType, day); cleared on getLatest()
     self.catButtons   = {}                                                      # Dictionary to store references to buttons that will change outlook type (categorical, tornado, etc.)
 
     labelFont = self.font()                                                     # Get font for self
@@ -142,6 +376,12 @@ class SPCWidget( SPC_Shapefiles, QWidget ):
     self.dayWidget = QWidget()                                                  # Make a widget
     layout         = QGridLayout()                                              # Define a grid layout
     layout.setColumnStretch(1, 10)                                              # Set middle column stretch to large number
+    self._dayBackBtn = QPushButton()                                            # Persistent back/forward buttons; the currentDay setter only retitles
+    self._dayBackBtn.clicked.connect( self._dayBackward )                       # and shows/hides them rather than rebuilding widgets per click
+    self._dayFwdBtn  = QPushButton()
+    self._dayFwdBtn.clicked.connect( self._dayForward )
+    layout.addWidget( self._dayBackBtn, 0, 0 )                                  # Add widget to first row, first column
+    layout.addWidget( self._dayFwdBtn,  0, 2 )                                  # Add widget to first row, third column
     self.dayWidget.setLayout( layout )                                          # Set widget layout
 
     self.catWidget = QWidget()                                                  # Initialize widget
@@ -162,35 +402,41 @@ class SPCWidget( SPC_Shapefiles, QWidget ):
 
     self.show()                                                                 # Show
 
+    self._nextUpdate = None                                                     # When the armed timer is due; lets showEvent() spot checks missed while hidden
     self._timer = QTimer()                                                      # Initialize timer
+    self._timer.setSingleShot( True )                                           # Rescheduled after every check; see _scheduleUpdate()
     self._timer.timeout.connect( self.updateOutlook )                           # Run updateOutlook method on timer time out
-    self._timer.start( 1000 * 60 * 5 )                                          # Start timer with 5 minute run time
+    self._scheduleUpdate()                                                      # First check lands just after the next scheduled SPC issuance
 
-  # Property for valid start time of outlook; used to return in 'fancy' format
+  # Property for valid start time of outlook; used to return in 'fancy' format.
+  # The formatted string is cached by the setter so repeat reads skip strftime
   @property
   def start(self):
-    return self._start.strftime( '%H%MZ %a %m/%d' )
+    return self._startStr
   @start.setter
   def start(self, val):
-    self._start = val
+    self._start    = val
+    self._startStr = val.strftime( '%H%MZ %a %m/%d' )
 
   # Property for valid end time of outlook; used to return in 'fancy' format
   @property
   def end(self):
-    return self._end.strftime( '%H%MZ %a %m/%d' )
+    return self._endStr
   @end.setter
   def end(self, val):
-    self._end = val
+    self._end    = val
+    self._endStr = val.strftime( '%H%MZ %a %m/%d' )
 
   # Property for issued time of outlook
   @property
   def issued(self):
-    return self._issued.strftime( '%H%MZ %m/%d/%Y' )                            # Return issued time as fancy format
+    return self._issuedStr                                                      # Return issued time as fancy format
   @issued.setter
   def issued(self, val):
     if not isinstance(val, datetime):                                           # If input value is NOT datetime
       return                                                                    # Return
-    self._issued = val                                                          # Update hidden issued
+    self._issued    = val                                                       # Update hidden issued
+    self._issuedStr = val.strftime( '%H%MZ %m/%d/%Y' )
     if (val.minute % 30) > 0:                                                   # If minutes NOT multiple of 30
       val += timedelta(minutes=30)                                              # Increment time by 30 minutes
       val = val.replace(minute = 30 if val.minute >= 30 else 0)                 # Set mintues to 0 or 30 based on new minuets
@@ -217,18 +463,17 @@ class SPCWidget( SPC_Shapefiles, QWidget ):
   def currentDay(self, val):
     if not isinstance(val, int): return
     self._currentDay = val                                                      # Update current day
-    layout = self.dayWidget.layout()                                            # Get layout from dayWidget
-    for i in range( len(layout) ):                                              # Iterate over all elements in layout
-      layout.itemAt(i).widget().deleteLater()                                   # Delete each object
 
     if self.currentDay > 1:                                                     # If current day greater than one (1)
-      button = QPushButton( f'Day {self.currentDay-1} Outlook' )                # Add button to go back one (1) day
-      button.clicked.connect( self._dayBackward )                               # Connect the _dayBackward method
-      layout.addWidget( button, 0, 0 )                                          # Add widget to first row, first column
+      self._dayBackBtn.setText( f'Day {self.currentDay-1} Outlook' )            # Retitle button to go back one (1) day
+      self._dayBackBtn.show()
+    else:
+      self._dayBackBtn.hide()
     if self.currentDay < 3:                                                     # If current day less than 3
-      button = QPushButton( f'Day {self.currentDay+1} Outlook' )                # Add button to go forward one (1) day
-      button.clicked.connect( self._dayForward )                                # Connec the _dayForward method
-      layout.addWidget( button, 0, 2 )                                          # Add widget to first row, third column
+      self._dayFwdBtn.setText( f'Day {self.currentDay+1} Outlook' )             # Retitle button to go forward one (1) day
+      self._dayFwdBtn.show()
+    else:
+      self._dayFwdBtn.hide()
 
     self._updateCatWidget()                                                     # Call the _updateCatWidget method
 
@@ -251,31 +496,200 @@ class SPCWidget( SPC_Shapefiles, QWidget ):
     canvas      = FigureCanvas( Figure( figsize = (10,8), tight_layout=True ) ) # Initialize figure canvas
     self.ax     = canvas.figure.add_subplot( projection = ccrs.LambertConformal() )# Initialize map axes
 
-    shpfilename = shpreader.natural_earth(resolution=RESOLUTION,
-                                          category='cultural',
-                                          name='admin_0_countries')             # Get path to cartopy shape file file cultural boundaries
-    reader = shpreader.Reader(shpfilename)                                      # Open the shape file
-    extent = Polygon.from_bounds( EXTENT[0], EXTENT[2], EXTENT[1], EXTENT[3] )  # Generate polygon using the extent of the map
-    for country in reader.records():                                            # Iterate over each country in the shape file records
-      if country.geometry.intersects( extent ):                                 # If the geometry of the country intersects the map domain
-        if country.attributes['NAME'] != 'United States of America':            # If the name of the country is NOT the USA
-          geo = country.geometry                                                # Get country geometry
-          if not isinstance( geo, (tuple, list) ): geo = [geo]                  # If the geometry is NOT a list or tuple, convert to list
-          self.ax.add_geometries(geo, ccrs.PlateCarree(),
-                            facecolor = NOT_USA, zorder=1)                      # Color in the country
-    reader.close()                                                              # Close the shape file
-
-    self.ax.add_feature( cfeature.OCEAN.with_scale(RESOLUTION), color = WATER)  # Color oceans
-    self.ax.add_feature( cfeature.LAKES.with_scale(RESOLUTION), color = WATER)  # Color lakes
-    self.ax.add_feature( cfeature.STATES.with_scale(RESOLUTION), linewidth = 0.5)# Show state borders
-    self.ax.coastlines( resolution = RESOLUTION, linewidth = 0.5 )              # Show coastlines
+    self._baseResolution = None                                                 # natural_earth scale of the current basemap artists
+    self._baseArtists    = []
+    self._setBaseResolution(
+      resolutionForSpan( max( EXTENT[1]-EXTENT[0], EXTENT[3]-EXTENT[2] ) ) )    # Build the basemap at the scale matching the full domain
+    canvas.mpl_connect( 'draw_event', self._onDrawCheckResolution )             # Re-check the scale whenever pan/zoom forces a full render
     self.ax.set_extent( EXTENT )                                                # SEt the map extent
-    self.timeInfoText = self.ax.text(0.025, 0.025, ' ', 
+    self.timeInfoText = self.ax.text(0.025, 0.025, ' ',
       transform       = self.ax.transAxes,
-      zorder          = 10, 
+      zorder          = 10,
       backgroundcolor = 'white' )                                               # Initialize a text object that will display the vaild/issed date information
+    self.timeInfoText.set_animated( True )                                      # Blitted on top of the cached basemap by _refresh()
+
+    # Persistent outlook artists; _draw() mutates these in place instead of
+    # removing and recreating them, skipping add_collection()'s bookkeeping
+    self._polyColl = PathCollection( [],
+            alpha      = 0.7,
+            zorder     = 5,
+            linewidths = 1.5,
+            transform  = self.ax.transData )                                    # Paths are pre-projected into the map CRS; no PROJ work at draw time
+    self._signColl = PathCollection( [],
+            facecolors = 'none',
+            hatch      = '..',
+            linestyle  = '--',
+            alpha      = 0.7,
+            zorder     = 6,
+            linewidths = 1.5,
+            transform  = self.ax.transData )
+    self._legend   = None                                                       # Rebuilt per draw; its content tracks the outlook type
+    self._lowRiskText = self.ax.annotate( '', (0.5, 0.5),
+            xycoords            = 'figure fraction',
+            verticalalignment   = 'center',
+            horizontalalignment = 'center',
+            fontsize            = 'xx-large')
+    self._lowRiskText.set_visible( False )
+    for artist in (self._polyColl, self._signColl, self._lowRiskText):
+      artist.set_animated( True )                                               # Excluded from full renders; painted on top by _refresh()
+    self.ax.add_collection( self._polyColl )
+    self.ax.add_collection( self._signColl )
+
+    self._lastData   = None                                                     # Parsed data behind the current collections; re-culled when the view changes
+    self._cullExtent = None                                                     # Map-CRS extent the current path set was culled against
+
+    self._bg = None                                                             # Rendered basemap pixels; captured again after every full render
+    canvas.mpl_connect( 'draw_event',   self._onDraw )                          # Registered after the resolution check so the capture sees the final basemap
+    canvas.mpl_connect( 'resize_event', self._onResize )
+
+    self._screenPrint   = canvas.print_figure                                   # savefig/print path; wrapped so the animated outlook artists are included
+    canvas.print_figure = self._printFigure
 
     return canvas                                                               # Return the figure canvas
+
+  def _printFigure(self, *args, **kwargs):
+    """
+    print_figure wrapper that renders the outlook artists
+
+    The outlook artists are animated so interactive full renders skip
+    them (the blit pipeline paints them itself), but savefig-style
+    renders -- e.g., the toolbar Save button -- would otherwise write a
+    basemap-only image. Clear the flag for the duration of the print
+    and restore it after.
+
+    """
+
+    artists = [ artist
+      for artist in (self._polyColl, self._signColl, self._legend,
+                     self._lowRiskText, self.timeInfoText)
+      if artist is not None ]
+    for artist in artists:
+      artist.set_animated( False )
+    try:
+      return self._screenPrint( *args, **kwargs )
+    finally:
+      for artist in artists:
+        artist.set_animated( True )
+
+  def _setBaseResolution(self, res):
+    """
+    (Re)build the basemap features at the given natural_earth scale
+
+    Wide views do not need 50m/10m detail and small views deserve better
+    than 50m; swapping scales keeps the vertex count proportional to
+    what is actually visible. All geometries come from the on-disk
+    caches, so a swap costs an unpickle, not a shapefile parse.
+
+    """
+
+    if res == self._baseResolution:
+      return
+    self._baseResolution = res
+    self.log.debug( f'Building basemap features at {res}' )
+
+    for artist in self._baseArtists:
+      artist.remove()
+
+    pc = ccrs.PlateCarree()
+    self._baseArtists = [
+      self.ax.add_geometries( nonUSGeoms( res, tuple(EXTENT) ), pc,
+                        facecolor = NOT_USA, zorder = 1 ),                      # Color in all non-US countries; one artist, geometries cached across runs
+      self.ax.add_geometries( featureGeoms('OCEAN',     res), pc,
+                        color = WATER, zorder = 0 ),                            # Color oceans
+      self.ax.add_geometries( featureGeoms('LAKES',     res), pc,
+                        color = WATER, zorder = 2 ),                            # Color lakes
+      self.ax.add_geometries( featureGeoms('STATES',    res), pc,
+                        facecolor = 'none', edgecolor = 'black',
+                        linewidth = 0.5, zorder = 2 ),                          # Show state borders
+      self.ax.add_geometries( featureGeoms('COASTLINE', res), pc,
+                        facecolor = 'none', edgecolor = 'black',
+                        linewidth = 0.5, zorder = 2 ),                          # Show coastlines
+    ]
+    self._bg = None                                                             # Basemap changed; cached pixels are stale
+
+  def _onDrawCheckResolution(self, *args):
+    """Swap basemap scale when pan/zoom moves the view across a span threshold"""
+
+    try:
+      lon0, lon1, lat0, lat1 = self.ax.get_extent( ccrs.PlateCarree() )
+    except Exception:                                                           # Extent not set yet
+      return
+    res = resolutionForSpan( max( abs(lon1 - lon0), abs(lat1 - lat0) ) )
+    if res != self._baseResolution:
+      self._setBaseResolution( res )
+      self.ax.figure.canvas.draw_idle()                                         # Render the new scale; no-ops on the follow-up draw_event
+
+  def _onResize(self, *args):
+    """Resize invalidates the cached basemap background"""
+
+    self._bg = None                                                             # Qt issues a full render after the resize; _onDraw() recaptures and repaints
+
+  def _onDraw(self, *args):
+    """
+    Recapture the basemap and repaint the outlook after any full render
+
+    The outlook artists are animated, so full renders -- triggered by
+    toolbar pan/zoom, a resize, or _refresh() on a cold cache -- leave
+    them out. This handler runs after every such render, caching the
+    fresh basemap pixels and painting the outlook back on top so it
+    never flickers out of the view.
+
+    """
+
+    canvas = self.ax.figure.canvas
+    if self._lastData is not None:
+      try:
+        extent = self.ax.get_extent()
+      except Exception:
+        extent = None
+      if extent != self._cullExtent:                                            # Pan/zoom moved the view; re-cull so records scrolled into view appear
+        self._applyPaths( self._lastData )
+    self._bg = canvas.copy_from_bbox( canvas.figure.bbox )
+    for artist in (self._polyColl, self._signColl, self._legend,
+                   self._lowRiskText, self.timeInfoText):
+      if artist is not None:
+        self.ax.draw_artist( artist )
+
+  def _applyPaths(self, data):
+    """Load the records visible in the current view into the collections"""
+
+    try:
+      self._cullExtent = self.ax.get_extent()
+    except Exception:
+      self._cullExtent = None
+
+    index = self._visibleIndex( data['bounds'] )                                # Only records whose bounding box touches the view are handed to the collection
+    self._polyColl.set_paths(      [ data['paths'][i]     for i in index ] )    # In-place update; skips remove()/add_collection() bookkeeping
+    self._polyColl.set_facecolor(  [ data['faceColor'][i] for i in index ] )
+    self._polyColl.set_edgecolor(  [ data['edgeColor'][i] for i in index ] )
+    index = self._visibleIndex( data['signBounds'] )
+    self._signColl.set_paths(      [ data['signPaths'][i] for i in index ] )
+    self._signColl.set_edgecolor(  [ data['signEdge'][i]  for i in index ] )
+
+  def _refresh(self):
+    """
+    Render the canvas, blitting the outlook over the cached basemap
+
+    The basemap (countries/ocean/lakes/states/coastlines) is by far the
+    most expensive content and never changes, so it is rendered once --
+    with the animated outlook artists excluded -- and its pixels cached.
+    Every draw after that restores the cached region and paints only the
+    outlook collections, legend, and time text on top.
+
+    """
+
+    canvas = self.ax.figure.canvas
+    if self._bg is None:                                                        # First render, or stale after a resize
+      canvas.draw()                                                             # _onDraw() captures the basemap and paints the outlook on top
+      canvas.blit( canvas.figure.bbox )
+      return
+
+    canvas.restore_region( self._bg )
+    for artist in (self._polyColl, self._signColl, self._legend,
+                   self._lowRiskText, self.timeInfoText):
+      if artist is not None:
+        self.ax.draw_artist( artist )
+    canvas.blit( canvas.figure.bbox )
     
   def _updateCatWidget(self):
     """
@@ -289,20 +703,30 @@ class SPCWidget( SPC_Shapefiles, QWidget ):
 
     self.log.debug( 'Updating the outlook type widget' )
     layout = self.catWidget.layout()                                            # Get layout from widget
-    for key in list(self.catButtons.keys()):                                    # Iterate over all keys in the catButtons attribute
-      self.catButtons.pop( key ).deleteLater()                                  # Pop key from dictionary and remove from the gui
-
-    for i, key in enumerate( self[ self.currentDay ] ):                         # Iterate over all keys in current day
-      self.log.debug( f'Adding button: {key}' )
-      button = QPushButton( key )                                               # Create button for current day
-      button.setCheckable( True )                                               # Set checkable
-      button.clicked.connect(
-        lambda state, arg = key: self._on_outlookType_Select( arg )
-      )                                                                         # Connect method to run on button click
-      layout.addWidget( button )                                                # Add button to widget layout
-      self.catButtons[key] = button                                             # Add button to the catButtons dictioanry
-      if i == 0:                                                                # If first button
-        self.outlookType = key                                                  # Set the outlook type to type of key; this will trigger draw of map
+    needed = list( self[ self.currentDay ] )                                    # Outlook types available for the current day
+
+    for key, button in self.catButtons.items():                                 # Hide buttons for types the day does not offer; no deleteLater()/rebuild
+      if key not in needed:
+        button.hide()
+
+    for key in needed:                                                          # Iterate over all keys in current day
+      button = self.catButtons.get( key )
+      if button is None:                                                        # First time this type appears; created once, reused for the app lifetime
+        self.log.debug( f'Adding button: {key}' )
+        button = QPushButton( key )                                             # Create button for current day
+        button.setCheckable( True )                                             # Set checkable
+        button.clicked.connect(
+          lambda state, arg = key: self._on_outlookType_Select( arg )
+        )                                                                       # Connect method to run on button click
+        layout.addWidget( button )                                              # Add button to widget layout
+        self.catButtons[key] = button                                           # Add button to the catButtons dictioanry
+      button.show()
+
+    current = getattr( self, '_outlookType', None )
+    if current not in needed:                                                   # Selection gone (or never made); fall back to the first available type
+      current = needed[0] if needed else None
+    if current is not None:
+      self.outlookType = current                                                # Keeps the user's selection across refreshes; triggers draw of map
 
   def _draw( self, **kwargs ):
     """
@@ -326,60 +750,166 @@ class SPCWidget( SPC_Shapefiles, QWidget ):
         kwargs[key] = val
     minProb = kwargs.pop('minProb', '')
 
-    while len(self.artists) > 0:
-      self.artists.pop().remove()
+    key = (self.outlookType, day)
+    if key in self._parsedCache:                                                # Parsed this getLatest() cycle already; toggles skip all I/O and parsing
+      data = self._parsedCache[ key ]
+    else:
+      self.log.debug('Reading data from shapefile')
+      data = self._parsedCache[ key ] = self._parseShapefile( shapeFileInfo )
+
+    if self._legend is not None:                                                # Legend content tracks the outlook type; rebuild per draw
+      self._legend.remove()
+      self._legend = None
+
+    self._lastData = data                                                       # Remembered so _onDraw() can re-cull after pan/zoom
+    if data is None:
+      self.log.debug( 'No polygons to draw' )
+      self._polyColl.set_paths( [] )                                            # Persistent collections; emptied rather than removed
+      self._signColl.set_paths( [] )
+      txt = f'LESS THAN {minProb}% ALL AREAS' if minProb else 'LOW RISK'
+      self._lowRiskText.set_text( txt )
+      self._lowRiskText.set_visible( True )
+    else:
+      self.log.debug('Drawing shapes')
+      self.start, self.end, self.issued = data['start'], data['end'], data['issued']
+      self._lowRiskText.set_visible( False )
+
+      self._applyPaths( data )                                                  # Cull to the current view; _onDraw() re-culls when the view changes
+
+      handles = data['handles']
+      if self.outlookType.startswith('Cat'):                                    # If workin got Categorical
+        handles = flip(handles, kwargs['ncol'])                                 # Flip the handles
+      self._legend = self.ax.legend( handles=handles, **kwargs,
+            loc        = 'lower right',
+            framealpha = 1,
+            title      = self.getLegendTitle()
+      )                                                                         # Build legend
+      self._legend.set_zorder( 10 )                                             # Set zorder of legend os is ALWAYS on top
+      self._legend.set_animated( True )                                         # Excluded from full renders; _refresh() paints it over the cached basemap
+
+    self.timeInfoText.set_text( self.getTimeInfo() )                            # Get time info and use it to set the time info text label
+
+    self._refresh()                                                             # Repaint; only the outlook artists are rendered in the common case
+
+  def _visibleIndex(self, bounds):
+    """
+    Indices of records whose bounding box overlaps the current view
+
+    Arguments:
+      bounds (ndarray) : (n, 4) array of (x0, y0, x1, y1) per record, in
+        the map projection's coordinates
 
-    self.log.debug('Reading data from shapefile')
-    with ShapeReader( **shapeFileInfo ) as shp:
-      fields = [field[0] for field in shp.fields]
+    """
+
+    if len(bounds) == 0:
+      return []
+    try:
+      x0, x1, y0, y1 = self.ax.get_extent()                                     # Native map-CRS extent; bounds are pre-projected to match
+    except Exception:                                                           # Extent not resolvable; draw everything
+      return range( len(bounds) )
+    return numpy.where( (bounds[:, 0] <= x1) & (bounds[:, 2] >= x0) &
+                        (bounds[:, 1] <= y1) & (bounds[:, 3] >= y0) )[0]        # One vectorized bbox test; a spatial tree costs more than it saves at this size
+
+  def _parseShapefile( self, shapeFileInfo ):
+    """
+    Parse one outlook shapefile into plot-ready vertex and color lists
 
+    Runs at most once per (outlookType, day) between getLatest() calls;
+    _draw() caches the result so category/day switches only rebuild
+    artists, never re-read or re-parse the shapefile.
+
+    Returns:
+      dict : Vertex lists, per-ring colors, legend handles, and outlook
+        times; None when the shapefile contains no polygons
+
+    """
+
+    reader = shapeFileInfo.get('reader')
+    if reader is None:                                                          # First parse of this archive; the header and DBF field table are read once
+      reader = shapeFileInfo['reader'] = ShapeReader(
+        shp = shapeFileInfo['shp'], dbf = shapeFileInfo['dbf'] )                # Stored on the info dict, so getLatest() replacing the dict drops the reader too
+
+    with reader as shp:
+      fields = [field[0] for field in shp.fields]
       if 'LABEL' not in fields:
-        self.log.debug( 'No polygons to draw' )
-        txt = f'LESS THAN {minProb}% ALL AREAS' if minProb else 'LOW RISK'
-        txt = self.ax.annotate( txt, (0.5, 0.5), 
-                xycoords            = 'figure fraction', 
-                verticalalignment   = 'center',
-                horizontalalignment = 'center',
-                fontsize            = 'xx-large') 
-
-        self.artists.append( txt )
-      else: 
-        self.log.debug('Drawing shapes')
-        handles = []                                                            # Handles for legend
-        for record in shp.shapeRecords():
-          self.start, self.end, self.issued, info = parseRecord(fields, record.record)
-          poly  = PolygonPatch( record.shape.__geo_interface__, **info,
-                    alpha     = 0.7, 
-                    zorder    = 5,  
-                    linewidth = 1.5,
-                    transform = ccrs.PlateCarree())
-          self.artists.append( self.ax.add_patch( poly ) )
-          handles.append( Patch( facecolor=info.get('facecolor', None),
+        return None
+
+      handlers   = fieldHandlers( fields )                                      # Field dispatch resolved once per shapefile, not per record
+      start      = end = issued = None
+      handles    = {}                                                           # Handles for legend; one proxy per unique (label, face, edge), insertion ordered
+      rings      = []                                                           # Every ring of the filled records, flat, for one batched simplify
+      ringCount  = []                                                           # Rings per filled record; recovers record grouping after simplify
+      faceColor  = []                                                           # Per-record colors
+      edgeColor  = []
+      signRings  = []                                                           # Significant-severe areas; hatched, unfilled, drawn as their own collection
+      signCount  = []
+      signEdge   = []
+      for record in shp.iterShapeRecords():                                     # Generator; streams shape/record pairs instead of materializing the full list
+        start, end, issued, info = parseRecord(handlers, record.record)
+        points  = numpy.asarray( record.shape.points, dtype = numpy.float64 )   # One bulk conversion; no per-vertex Python tuples downstream
+        recRings = numpy.split( points, record.shape.parts[1:] )                # Ring i starts at parts[i]; split() yields views, not copies
+        if info.get('fill') is True or 'fill' not in info:                      # Regular filled outlook area
+          rings.extend( recRings )
+          ringCount.append( len(recRings) )
+          faceColor.append( info.get('facecolor', 'none') )
+          edgeColor.append( info.get('edgecolor', 'none') )
+        else:                                                                   # SIGN area; hatched with dashed outline
+          signRings.extend( recRings )
+          signCount.append( len(recRings) )
+          signEdge.append( info.get('edgecolor', 'black') )
+        hkey = ( info.get('label'), info.get('facecolor'), info.get('edgecolor') )
+        if hkey not in handles:                                                 # Records sharing a risk level share one legend entry
+          handles[hkey] = Patch( facecolor=info.get('facecolor', None),
                                  edgecolor=info.get('edgecolor', None),
-                                 label    =info.get('label',     None) ) )      # Build object for legend; this is done to ensure that any hatched areas on map appear as filled box in legend
-
-        if self.outlookType.startswith('Cat'):                                  # If workin got Categorical
-          handles = flip(handles, kwargs['ncol'])                               # Flip the handles
-        legend = self.ax.legend( handles=handles, **kwargs,
-              loc        = 'lower right',
-              framealpha = 1, 
-              title      = self.getLegendTitle()
-        )                                                                       # Build legend
-        legend.set_zorder( 10 )                                                 # Set zorder of legend os is ALWAYS on top
-        self.artists.append( legend )                                           # Append legend artist to the list of artists
-
-      self.timeInfoText.set_text( self.getTimeInfo() )                          # Get time info and use it to set the time info text label
-  
-    self.ax.figure.canvas.draw_idle()                                           # Trigger redraw of the map
+                                 label    =info.get('label',     None) )        # Build object for legend; this is done to ensure that any hatched areas on map appear as filled box in legend
+
+    if self.SIMPLIFY_TOL:                                                       # Simplify every ring of the shapefile in one batch
+      rings     = simplifyRings( rings,     self.SIMPLIFY_TOL )
+      signRings = simplifyRings( signRings, self.SIMPLIFY_TOL )
+
+    rings     = projectRings( rings,     self.ax.projection )                   # Project into the map CRS here, not on every draw
+    signRings = projectRings( signRings, self.ax.projection )
+
+    paths     = []                                                              # One compound Path per record; interior rings become holes
+    signPaths = []
+    i         = 0
+    for n in ringCount:
+      paths.append( compoundPath( rings[i:i+n] ) )
+      i += n
+    i = 0
+    for n in signCount:
+      signPaths.append( compoundPath( signRings[i:i+n] ) )
+      i += n
+
+    bounds     = numpy.array(
+      [ path.get_extents().extents for path in paths     ] ).reshape( -1, 4 )   # Per-record (x0, y0, x1, y1); lets _draw() cull to the visible extent
+    signBounds = numpy.array(
+      [ path.get_extents().extents for path in signPaths ] ).reshape( -1, 4 )
+
+    return {'start'      : start,
+            'end'        : end,
+            'issued'     : issued,
+            'handles'    : list( handles.values() ),
+            'paths'      : paths,
+            'bounds'     : bounds,
+            'faceColor'  : faceColor,
+            'edgeColor'  : edgeColor,
+            'signPaths'  : signPaths,
+            'signBounds' : signBounds,
+            'signEdge'   : signEdge}
 
   def getTimeInfo(self):
-    """Construct outlook time information text"""
-
-    txt = [
-      f'SPC DAY {self.currentDay} {self.outlookType.upper()} OUTLOOK',
-      f'ISSUED: {self.issued}',
-      f'VALID: {self.start} - {self.end}']
-    return '\n'.join( txt )
+    """Construct outlook time information text; cached until an input changes"""
+
+    key = ( self.currentDay, self.outlookType,
+            self.start, self.end, self.issued )
+    if key != getattr( self, '_timeInfoKey', None ):
+      self._timeInfoKey = key
+      self._timeInfo    = '\n'.join( [
+        f'SPC DAY {self.currentDay} {self.outlookType.upper()} OUTLOOK',
+        f'ISSUED: {self.issued}',
+        f'VALID: {self.start} - {self.end}'] )
+    return self._timeInfo
 
   def getLegendTitle(self):
     """Construct title for legend based on outlook type"""
@@ -391,7 +921,104 @@ class SPCWidget( SPC_Shapefiles, QWidget ):
     return f'{self.outlookType} Probability Legend (in %)'
 
   def updateOutlook(self):
-    """Download lastest data and refresh maps"""
+    """Download lastest data off the main thread and refresh maps when it lands"""
+
+    fetcher = Fetcher( self._fetchLatest )                                      # Download and parsing run in the global thread pool; GUI thread only redraws
+    fetcher.signals.finished.connect( self._applyOutlook )
+    QThreadPool.globalInstance().start( fetcher )
+
+  def _fetchLatest(self):
+    """
+    Download and pre-parse the latest outlooks; runs in a worker thread
+
+    Every (outlookType, day) shapefile is parsed here so the GUI thread
+    receives plot-ready arrays and does zero parsing on the paint path.
+    The fresh shapefile dicts stay private to the worker -- the GUI
+    thread keeps drawing from the published set, so its readers never
+    touch the same ShapeReader mid-parse -- and _applyOutlook()
+    publishes dicts and parsed data together.
+
+    Returns:
+      tuple : (category tuple, replacement for _parsedCache), or None
+        when nothing changed
+
+    """
+
+    categories = self.getLatest( publish = False )
+    if categories is None:
+      return None
+
+    parsed = {}
+    for name, days in categories:
+      for day, info in days.items():
+        parsed[ (name, day) ] = self._parseShapefile( info )
+    return categories, parsed
+
+  def closeEvent(self, event):
+    self._closed = True
+    self._timer.stop()
+    super().closeEvent( event )
+
+  def hideEvent(self, event):
+    """No downloads or redraws while the widget is not visible"""
+
+    if getattr( self, '_timer', None ) is not None:                             # show()/hide() fire during __init__, before the timer exists
+      self._timer.stop()
+    super().hideEvent( event )
+
+  def showEvent(self, event):
+    super().showEvent( event )
+    timer = getattr( self, '_timer', None )
+    if timer is None or timer.isActive() or self._closed:
+      return
+    if self._nextUpdate is not None and datetime.utcnow() >= self._nextUpdate:
+      self.updateOutlook()                                                      # An issuance passed while hidden; catch up immediately
+    else:
+      self._scheduleUpdate()                                                    # Nothing missed; re-arm for the next issuance
+
+  def _applyOutlook(self, result):
+    """Slot run on the GUI thread once a background fetch completes"""
+
+    if self._closed:                                                            # Widget closed while the worker was fetching; drop the result
+      return
+    if result is None:                                                          # Nothing new was issued (or the fetch failed); retry on a short interval
+      self._scheduleUpdate( retry = True )
+      return
+
+    categories, parsed = result
+    self.publish( categories )                                                  # Dicts and parsed cache land together; _draw() never sees one without the other
+    self._parsedCache = parsed
+    self._updateCatWidget()                                                     # Refresh the type buttons for the new data; selecting one triggers the redraw
+    self._scheduleUpdate()
+
+  def _scheduleUpdate(self, retry = False):
+    """
+    Arm the update timer for the next scheduled SPC issuance
+
+    SPC outlooks are issued at fixed UTC times, so instead of polling
+    every five minutes the next check lands shortly after the next
+    issuance. When a check comes back unchanged (issuance running
+    late), retry on a short interval until it arrives.
+
+    """
+
+    if retry:
+      self._nextUpdate = datetime.utcnow() + timedelta( minutes = 5 )
+      self._timer.start( 1000 * 60 * 5 )                                        # Issuance not posted yet; check again in 5 minutes
+      return
 
-    self.getLatest()
-    self._draw()
+    now = datetime.utcnow()
+    for hhmm in self.ISSUANCE_UTC:
+      nxt = now.replace( hour   = hhmm // 100, minute = hhmm % 100,
+                         second = 0,           microsecond = 0 )
+      nxt = nxt + timedelta( minutes = 5 )                                      # Small grace period after the nominal issuance time
+      if nxt > now:
+        break
+    else:                                                                       # Past today's last issuance; next is tomorrow's first
+      hhmm = self.ISSUANCE_UTC[0]
+      nxt  = now.replace( hour   = hhmm // 100, minute = hhmm % 100,
+                          second = 0,           microsecond = 0 )
+      nxt  = nxt + timedelta( days = 1, minutes = 5 )
+
+    self._nextUpdate = nxt
+    self._timer.start( int( (nxt - now).total_seconds() * 1000 ) )
@@ -1,3 +1,6 @@
+from datetime import datetime
+from functools import lru_cache
+
 from qtpy.QtWidgets import QWidget, QLineEdit, QLabel, QVBoxLayout
 from qtpy.QtCore import QTimer
 
@@ -7,9 +10,8 @@ from matplotlib.figure import Figure
 
 import numpy 
 
-from metpy.calc import wind_components
 from metpy.io import parse_metar_to_dataframe
-from metpy.units import units 
+from metpy.units import units
 from metpy.plots import StationPlot, StationPlotLayout, sky_cover
 
 METAR_UNITS = {'air_temperature'       : units.degC,
@@ -17,9 +19,11 @@ METAR_UNITS = {'air_temperature'       : units.degC,
 
 def parseMETAR( METAR ):
   metar = parse_metar_to_dataframe( METAR )
-  u, v  = wind_components( metar['wind_speed'    ].values * units('knots'),
-                           metar['wind_direction'].values * units.degree )
-  data = {'u_wind' : u, 'v_wind' : v}
+  ws    = metar['wind_speed'].values
+  wd    = numpy.deg2rad( metar['wind_direction'].values )
+  knots = units('knots')
+  data  = {'u_wind' : -ws * numpy.sin( wd ) * knots,                            # wind_components() on plain arrays; units attached once to the results
+           'v_wind' : -ws * numpy.cos( wd ) * knots}
   for var, unit in METAR_UNITS.items():
     data[var] = metar[var] * unit
 
@@ -28,13 +32,25 @@ def parseMETAR( METAR ):
 
   return data
 
-class StationFigure( FigureCanvas ):
-  STATION_LAYOUT = StationPlotLayout()
-  STATION_LAYOUT.add_barb('u_wind', 'v_wind', 'knot',        length=15, linewidth=5)
-  STATION_LAYOUT.add_value( (-4,  4), 'air_temperature',       fmt='.1f', units='degF')
-  STATION_LAYOUT.add_value( (-4, -4), 'dew_point_temperature', fmt='.1f', units='degF')
-  STATION_LAYOUT.add_symbol( (0, 0), 'cloud_coverage', sky_cover, fontsize=28)
+@lru_cache( maxsize = 1 )
+def stationLayout():
+  """
+  Shared StationPlotLayout, built on first use
+
+  Building the layout pulls in metpy's plot-symbol font machinery, so
+  deferring it keeps that cost off module import; every figure shares
+  the one instance.
+
+  """
+
+  layout = StationPlotLayout()
+  layout.add_barb('u_wind', 'v_wind', 'knot',        length=15, linewidth=5)
+  layout.add_value( (-4,  4), 'air_temperature',       fmt='.1f', units='degF')
+  layout.add_value( (-4, -4), 'dew_point_temperature', fmt='.1f', units='degF')
+  layout.add_symbol( (0, 0), 'cloud_coverage', sky_cover, fontsize=28)
+  return layout
 
+class StationFigure( FigureCanvas ):
   def __init__(self, fig = None):
     fig = Figure( figsize=(10,8) ) if fig is None else fig
     super().__init__( fig )
@@ -50,7 +66,7 @@ class StationFigure( FigureCanvas ):
     #if self.station is not None:
     #  self.station.remove()
     print( 'updating' )
-    self.STATION_LAYOUT.plot( self.station, data )
+    stationLayout().plot( self.station, data )
     self.draw()
 
 class StationWidget( QWidget):
@@ -59,6 +75,7 @@ class StationWidget( QWidget):
     self.stationID   = QLineEdit()
     self.stationPlot = StationFigure()
     self.time        = QLabel()
+    self._lastMETAR  = None                                                     # Raw report from the previous update; unchanged reports skip parse and plot
 
     self.updateStation()
 
@@ -74,9 +91,29 @@ class StationWidget( QWidget):
     self._timer.timeout.connect( self.updateStation )
     self._timer.start( 1000 * 60 * 30 )
 
+  def hideEvent(self, event):
+    """No parsing or redraws while the widget is not visible"""
+
+    if getattr( self, '_timer', None ) is not None:                             # show()/hide() fire during __init__, before the timer exists
+      self._timer.stop()
+    super().hideEvent( event )
+
+  def showEvent(self, event):
+    super().showEvent( event )
+    timer = getattr( self, '_timer', None )
+    if timer is None or timer.isActive():
+      return
+    if (datetime.utcnow() - self._lastUpdate).total_seconds() > 1800:
+      self.updateStation()                                                      # An update interval passed while hidden; catch up immediately
+    timer.start( 1000 * 60 * 30 )
+
   def updateStation(self):
+    self._lastUpdate = datetime.utcnow()
     station = self.stationID.text()
     METAR = 'KSLN 211953Z 35012G26KT 10SM FEW075 28/08 A3004 RMK AO2 PK WND 35026/1922 SLP158 T02830083'
+    if METAR == self._lastMETAR:                                                # Same report as last tick; nothing to re-parse or redraw
+      return
+    self._lastMETAR = METAR
     data  = parseMETAR( METAR )
     
     #data  = {'temp_c'     : numpy.random.random( (1,) ) * 20 * units.degC, 
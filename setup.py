@@ -14,7 +14,7 @@ setuptools.setup(
   author_email     = "wodzicki@tamu.com",
   version          = main_ns['__version__'],
   packages         = setuptools.find_packages(),
-  install_requires = [ "qtpy", "numpy", "matplotlib", "metpy", "shapely", "cartopy", "descartes" ],
+  install_requires = [ "qtpy", "numpy", "scipy", "lxml", "matplotlib", "metpy", "shapely", "cartopy" ],
   scripts          = ['bin/dcotssUtils'],
   zip_safe         = False,
 );